@@ -0,0 +1,46 @@
+"""communication flags to boolean
+
+Revision ID: 5b7e2d9a4c31
+Revises: 1c2253fc142e
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9a4c31'
+down_revision: Union[str, Sequence[str], None] = '1c2253fc142e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FLAG_COLUMNS = ('is_group_communication', 'is_cross_team')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('communications') as batch_op:
+        for column in _FLAG_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Integer(),
+                type_=sa.Boolean(),
+                existing_nullable=True,
+                postgresql_using=f'{column} <> 0',
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('communications') as batch_op:
+        for column in _FLAG_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Boolean(),
+                type_=sa.Integer(),
+                existing_nullable=True,
+                postgresql_using=f'{column}::integer',
+            )
@@ -0,0 +1,55 @@
+"""server side timestamp defaults
+
+Revision ID: c4a9e7b1d205
+Revises: 5b7e2d9a4c31
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e7b1d205'
+down_revision: Union[str, Sequence[str], None] = '5b7e2d9a4c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = (
+    ('teams', 'created_at'),
+    ('team_members', 'joined_at'),
+    ('communications', 'timestamp'),
+    ('team_metrics', 'calculated_at'),
+    ('external_teams', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in _TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                existing_nullable=True,
+                # Existing naive values were written as UTC
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in _TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                server_default=None,
+                existing_nullable=True,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,29 @@
+"""communication receiver index
+
+Revision ID: e2b6f0c83a19
+Revises: c4a9e7b1d205
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f0c83a19'
+down_revision: Union[str, Sequence[str], None] = 'c4a9e7b1d205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_receiver_timestamp', 'communications', ['receiver_id', 'timestamp'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_receiver_timestamp', table_name='communications')
@@ -5,7 +5,8 @@ This layer provides the REST API using Flask.
 Handles HTTP requests and responses, input validation, and error handling.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -13,19 +14,28 @@ from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.exc import IntegrityError, OperationalError
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 import traceback
-import os
+
+# orjson is an optional speedup for JSON responses; fall back to Flask's stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# flask-compress is optional; without it responses are sent uncompressed
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 from .database import init_db
-from .data_access.repositories import (
-    TeamRepository,
-    TeamMemberRepository,
-    CommunicationRepository,
-    TeamMetricsRepository,
-)
+from .data_access.repositories import CommunicationRepository, Repositories, TeamRepository
 from .business_logic import ThreeEsCalculator, NetworkAnalyzer
-from .config import Config
+from .config import Config, ValidationConstants
+from .date_utils import parse_date_range
+from .response_cache import ResponseCache
+from .background import JOB_FAILED, JobRunner
 from .validation import (
     TeamCreate,
     TeamUpdate,
@@ -35,20 +45,110 @@ from .validation import (
     MetricsCalculate,
     NetworkAnalysisParams,
     validate_request,
+    validate_many,
+)
+
+# Health probe statement, built once rather than on every load balancer check
+_HEALTH_PING = text("SELECT 1")
+
+# Static Prometheus HELP/TYPE preambles for /metrics
+_METRICS_TEAMS_HEADER = (
+    "# HELP orgnet_teams_total Total number of teams\n"
+    "# TYPE orgnet_teams_total gauge\n"
 )
+_METRICS_MEMBERS_HEADER = (
+    "# HELP orgnet_members_total Total number of team members\n"
+    "# TYPE orgnet_members_total gauge\n"
+)
+_METRICS_COMMUNICATIONS_HEADER = (
+    "# HELP orgnet_communications_estimated Approximate number of recorded communications\n"
+    "# TYPE orgnet_communications_estimated gauge\n"
+)
+
+
+@lru_cache(maxsize=1024)
+def _prometheus_team_label(team_id: int, name: str) -> str:
+    """Label-safe team name for /metrics, memoized across scrapes (keyed by id and name)"""
+    return name.replace(" ", "_").lower()
+
+
+def _serialize_metrics(value, ndigits: int = 3):
+    """Round floats in a metrics payload for the response; calculators keep full precision"""
+    if isinstance(value, float):
+        return round(value, ndigits)
+    if isinstance(value, dict):
+        return {k: _serialize_metrics(v, ndigits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_serialize_metrics(v, ndigits) for v in value]
+    return value
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (C-accelerated encoding/decoding)"""
+
+    # Integer dict keys (e.g. member ids in centrality maps) and numpy scalars/arrays
+    # are emitted the same way the stdlib encoder path would after conversion.
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def dumps_bytes(self, obj) -> bytes:
+        """Encode straight to UTF-8 bytes, skipping the str round trip of ``dumps``"""
+        return orjson.dumps(obj, default=self.default, option=self.option)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+class LegacyApiPrefix:
+    """WSGI middleware mapping deprecated ``/api/<path>`` URLs onto ``/api/v1/<path>``
+
+    Rewriting before routing keeps a single rule per endpoint in the URL map
+    (a Flask ``before_request`` hook runs after the URL has been matched).
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
 
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if path.startswith("/api/") and not path.startswith("/api/v1/"):
+            environ["PATH_INFO"] = "/api/v1" + path[4:]
+        return self.wsgi_app(environ, start_response)
 
-def create_app(config_class=Config):
-    """Application factory pattern"""
+
+def create_app(config_class=Config, engine=None):
+    """Application factory pattern
+
+    ``engine`` replaces the one built from ``DATABASE_URL`` (e.g. a test database
+    shared by several app instances); its schema must already exist.
+    """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    # Unversioned /api/* endpoints are served by their /api/v1/* rules
+    app.wsgi_app = LegacyApiPrefix(app.wsgi_app)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     # Enable CORS
     CORS(app)
 
+    # gzip/brotli for large JSON lists and /metrics (settings in Config.COMPRESS_*)
+    if Compress is not None:
+        Compress(app)
+
     # Initialize rate limiting
     # Use very high limits when TESTING to avoid flaky performance tests
-    storage_uri = os.getenv('RATELIMIT_STORAGE_URL', 'memory://')
+    storage_uri = app.config.get("RATELIMIT_STORAGE_URL", "memory://")
+    # Fail fast instead of stalling requests when the shared store is unreachable
+    storage_options = (
+        {"socket_connect_timeout": 1} if storage_uri.startswith(("redis://", "rediss://")) else {}
+    )
     default_limits = (
         ["10000 per hour"]  # Effectively unlimited for tests
         if app.config.get('TESTING', False)
@@ -59,6 +159,7 @@ def create_app(config_class=Config):
         app=app,
         key_func=get_remote_address,
         storage_uri=storage_uri,
+        storage_options=storage_options,
         default_limits=default_limits,
         strategy="fixed-window",
         headers_enabled=True,
@@ -71,17 +172,65 @@ def create_app(config_class=Config):
     _limit_network = "10000 per hour" if _testing else "30 per hour"
 
     # Initialize database
-    engine = init_db(app.config["DATABASE_URL"])
+    if engine is None:
+        engine = init_db(
+            app.config["DATABASE_URL"],
+            pool_size=app.config.get("DB_POOL_SIZE", 10),
+            max_overflow=app.config.get("DB_MAX_OVERFLOW", 20),
+            pool_timeout=app.config.get("DB_POOL_TIMEOUT", 30),
+            pool_recycle=app.config.get("DB_POOL_RECYCLE", 1800),
+        )
     session_factory = sessionmaker(bind=engine)
     Session = scoped_session(session_factory)
+    # Read-only endpoints never flush or commit, so skip autoflush and keep loaded
+    # attributes instead of expiring them
+    ReadSession = scoped_session(
+        sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    )
 
     # Store session factory in app context
     app.session_factory = Session
 
+    # Short-TTL cache for polled metrics responses (invalidated on recalculation)
+    response_cache = ResponseCache(
+        redis_url=app.config.get("REDIS_URL"),
+        ttl=app.config.get("RESPONSE_CACHE_TTL", 0),
+    )
+    app.response_cache = response_cache
+
+    # Background runner for opt-in asynchronous metric calculations
+    job_runner = JobRunner(
+        max_workers=app.config.get("BACKGROUND_WORKERS", 2),
+        redis_url=app.config.get("REDIS_URL"),
+        ttl=app.config.get("BACKGROUND_JOB_TTL", 86400),
+    )
+    app.job_runner = job_runner
+
+    def metrics_cache_keys(team_id):
+        return (f"metrics:team:{team_id}", "metrics:all")
+
+    def json_bytes(payload) -> bytes:
+        if isinstance(app.json, OrjsonProvider):
+            return app.json.dumps_bytes(payload)
+        return app.json.dumps(payload).encode()
+
+    def conditional_json(body):
+        """JSON response tagged with a content ETag; 304 with no body if If-None-Match matches"""
+        response = Response(body, mimetype="application/json")
+        response.add_etag()
+        return response.make_conditional(request)
+
+    def cached_json(cache_key, payload):
+        """Serialize payload, store it under cache_key and return it as a response"""
+        body = json_bytes(payload)
+        response_cache.set(cache_key, body)
+        return conditional_json(body)
+
     # Cleanup session after request
     @app.teardown_appcontext
     def shutdown_session(exception=None):
         Session.remove()
+        ReadSession.remove()
 
     # Error handlers
     @app.errorhandler(404)
@@ -92,94 +241,125 @@ def create_app(config_class=Config):
     def internal_error(error):
         return jsonify({"error": "Internal server error"}), 500
 
-    # Helper decorator for database sessions
-    def with_session(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            session = Session()
-            try:
-                result = f(session, *args, **kwargs)
-                session.commit()
-                return result
-            except IntegrityError as e:
-                session.rollback()
-                app.logger.warning(f"Integrity error in {f.__name__}: {str(e)}")
-                return (
-                    jsonify(
-                        {
-                            "error": "Data integrity violation",
-                            "detail": "This operation conflicts with existing data (duplicate or missing reference)",
-                        }
-                    ),
-                    409,
-                )
-            except OperationalError as e:
-                session.rollback()
-                app.logger.error(f"Database error in {f.__name__}: {str(e)}")
-                return (
-                    jsonify(
-                        {
-                            "error": "Database error",
-                            "detail": "Database operation failed. Please try again later.",
-                        }
-                    ),
-                    500,
-                )
-            except ValueError as e:
-                session.rollback()
-                app.logger.info(f"Validation error in {f.__name__}: {str(e)}")
-                return jsonify({"error": "Validation error", "detail": str(e)}), 400
-            except Exception as e:
-                session.rollback()
-                app.logger.error(f"Unexpected error in {f.__name__}: {str(e)}")
-                app.logger.error(traceback.format_exc())
-                return (
-                    jsonify(
-                        {"error": "Internal server error", "detail": "An unexpected error occurred"}
-                    ),
-                    500,
-                )
-            finally:
-                session.close()
-
-        return decorated_function
+    # Helper decorators for database sessions
+    def session_scope(registry, commit):
+        """Build a route decorator that injects a session from ``registry``"""
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                session = registry()
+                g.repos = Repositories(session)
+                try:
+                    result = f(session, *args, **kwargs)
+                    if commit:
+                        session.commit()
+                    return result
+                except IntegrityError as e:
+                    session.rollback()
+                    app.logger.warning(f"Integrity error in {f.__name__}: {str(e)}")
+                    return (
+                        jsonify(
+                            {
+                                "error": "Data integrity violation",
+                                "detail": "This operation conflicts with existing data (duplicate or missing reference)",
+                            }
+                        ),
+                        409,
+                    )
+                except OperationalError as e:
+                    session.rollback()
+                    app.logger.error(f"Database error in {f.__name__}: {str(e)}")
+                    return (
+                        jsonify(
+                            {
+                                "error": "Database error",
+                                "detail": "Database operation failed. Please try again later.",
+                            }
+                        ),
+                        500,
+                    )
+                except ValueError as e:
+                    session.rollback()
+                    app.logger.info(f"Validation error in {f.__name__}: {str(e)}")
+                    return jsonify({"error": "Validation error", "detail": str(e)}), 400
+                except Exception as e:
+                    session.rollback()
+                    app.logger.error(f"Unexpected error in {f.__name__}: {str(e)}")
+                    app.logger.error(traceback.format_exc())
+                    return (
+                        jsonify(
+                            {
+                                "error": "Internal server error",
+                                "detail": "An unexpected error occurred",
+                            }
+                        ),
+                        500,
+                    )
+                finally:
+                    session.close()
+
+            return decorated_function
+
+        return decorator
+
+    # Read/write endpoints commit on success; read-only endpoints skip the commit
+    with_session = session_scope(Session, commit=True)
+    with_read_session = session_scope(ReadSession, commit=False)
+
+    def date_window_from_args():
+        """
+        Validate the ``days`` query argument and resolve it to a look-back window
+
+        Returns:
+            Tuple of ((start_date, end_date), None) or (None, errors)
+        """
+        default_days = ValidationConstants.DEFAULT_ANALYSIS_DAYS
+        days = request.args.get("days", type=int, default=default_days)
+        params, errors = validate_request(NetworkAnalysisParams, {"days": days})
+        if errors:
+            return None, errors
+        return parse_date_range(days=params.days or default_days), None
 
     # ==================== Routes ====================
 
+    # Static API description, serialized once per app instead of on every request
+    index_body = json_bytes(
+        {
+            "name": "Three Es Organizational Network API",
+            "version": "1.0.0",
+            "description": "Measures Energy, Engagement, and Exploration for high-performance teams",
+            "api_version": "v1",
+            "rate_limits": {
+                "default": "200 per day, 50 per hour",
+                "calculation": "10 per hour (resource intensive)",
+            },
+            "endpoints": {
+                "teams": "/api/v1/teams",
+                "members": "/api/v1/members",
+                "communications": "/api/v1/communications",
+                "metrics": "/api/v1/metrics",
+                "calculate": "/api/v1/calculate/<team_id>",
+                "network": "/api/v1/network/<team_id>",
+            },
+            "legacy_endpoints_note": "Unversioned /api/* endpoints are supported for backward compatibility but deprecated",
+        }
+    )
+
     @app.route("/")
     @limiter.exempt  # Don't rate limit the info endpoint
     def index():
         """API information endpoint"""
-        return jsonify(
-            {
-                "name": "Three Es Organizational Network API",
-                "version": "1.0.0",
-                "description": "Measures Energy, Engagement, and Exploration for high-performance teams",
-                "api_version": "v1",
-                "rate_limits": {
-                    "default": "200 per day, 50 per hour",
-                    "calculation": "10 per hour (resource intensive)",
-                },
-                "endpoints": {
-                    "teams": "/api/v1/teams",
-                    "members": "/api/v1/members",
-                    "communications": "/api/v1/communications",
-                    "metrics": "/api/v1/metrics",
-                    "calculate": "/api/v1/calculate/<team_id>",
-                    "network": "/api/v1/network/<team_id>",
-                },
-                "legacy_endpoints_note": "Unversioned /api/* endpoints are supported for backward compatibility but deprecated",
-            }
-        )
+        return Response(index_body, mimetype="application/json")
 
     @app.route("/health")
     @limiter.exempt  # Don't rate limit health checks
     def health_check():
         """Health check endpoint for load balancers and monitoring"""
         try:
-            # Test database connection (SQLAlchemy 2.0 requires text() for raw SQL)
+            # Test database connection
             db_session = Session()
-            db_session.execute(text("SELECT 1"))
+            db_session.execute(_HEALTH_PING).scalar()
             db_session.close()
 
             return jsonify({
@@ -204,39 +384,36 @@ def create_app(config_class=Config):
         """Prometheus-style metrics endpoint"""
         try:
             session = Session()
-            
-            # Get basic stats
+
+            # One grouped query yields both the team list and per-team member counts
             team_repo = TeamRepository(session)
-            member_repo = TeamMemberRepository(session)
-            comm_repo = CommunicationRepository(session)
-            
-            teams = team_repo.get_all()
-            
-            metrics_lines = [
-                "# HELP orgnet_teams_total Total number of teams",
-                "# TYPE orgnet_teams_total gauge",
-                f"orgnet_teams_total {len(teams)}",
-                "",
-                "# HELP orgnet_members_total Total number of team members",
-                "# TYPE orgnet_members_total gauge",
-                f"orgnet_members_total {len(member_repo.get_all())}",
-                "",
-            ]
-            
-            # Per-team metrics
-            for team in teams:
-                members = member_repo.get_by_team(team.id)
-                team_name = team.name.replace(" ", "_").lower()
-                
-                metrics_lines.extend([
-                    f'orgnet_team_members{{team="{team_name}",team_id="{team.id}"}} {len(members)}',
-                ])
-            
+            team_counts = team_repo.get_all_with_member_counts()
+            # Planner estimate (PostgreSQL only): scrapes never scan the largest table
+            communications_estimate = CommunicationRepository(session).estimated_row_count()
+
             session.close()
-            
-            from flask import Response
-            return Response("\n".join(metrics_lines), mimetype="text/plain")
-            
+
+            # Query runs eagerly above so DB errors still map to a 500; the body is
+            # then streamed line by line instead of joined into one large string.
+            def generate():
+                yield _METRICS_TEAMS_HEADER
+                yield f"orgnet_teams_total {len(team_counts)}\n\n"
+                yield _METRICS_MEMBERS_HEADER
+                yield f"orgnet_members_total {sum(count for _, count in team_counts)}\n\n"
+                if communications_estimate is not None:
+                    yield _METRICS_COMMUNICATIONS_HEADER
+                    yield f"orgnet_communications_estimated {communications_estimate}\n\n"
+
+                # Per-team metrics
+                for team, member_count in team_counts:
+                    team_name = _prometheus_team_label(team.id, team.name)
+                    yield (
+                        f'orgnet_team_members{{team="{team_name}",team_id="{team.id}"}} '
+                        f"{member_count}\n"
+                    )
+
+            return Response(generate(), mimetype="text/plain")
+
         except Exception as e:
             app.logger.error(f"Metrics endpoint failed: {str(e)}")
             return Response("# Error generating metrics\n", mimetype="text/plain"), 500
@@ -245,12 +422,11 @@ def create_app(config_class=Config):
     # API v1 - All endpoints are versioned for future compatibility
 
     @app.route("/api/v1/teams", methods=["GET"])
-    @app.route("/api/teams", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_teams(session):
         """Get all teams"""
-        repo = TeamRepository(session)
-        teams = repo.get_all()
+        repo = g.repos.teams
+        teams = repo.get_all_with_member_counts()
         return jsonify(
             [
                 {
@@ -258,19 +434,18 @@ def create_app(config_class=Config):
                     "name": t.name,
                     "description": t.description,
                     "created_at": t.created_at.isoformat(),
-                    "member_count": len(t.members),
+                    "member_count": member_count,
                 }
-                for t in teams
+                for t, member_count in teams
             ]
         )
 
     @app.route("/api/v1/teams/<int:team_id>", methods=["GET"])
-    @app.route("/api/teams/<int:team_id>", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_team(session, team_id):
         """Get specific team"""
-        repo = TeamRepository(session)
-        team = repo.get_by_id(team_id)
+        repo = g.repos.teams
+        team = repo.get_by_id_with_members(team_id)
         if not team:
             return jsonify({"error": "Team not found"}), 404
 
@@ -288,7 +463,6 @@ def create_app(config_class=Config):
         )
 
     @app.route("/api/v1/teams", methods=["POST"])
-    @app.route("/api/teams", methods=["POST"])  # Backward compatibility
     @with_session
     def create_team(session):
         """Create a new team"""
@@ -298,7 +472,7 @@ def create_app(config_class=Config):
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
 
-        repo = TeamRepository(session)
+        repo = g.repos.teams
         team = repo.create(name=validated.name, description=validated.description)
 
         return (
@@ -314,7 +488,6 @@ def create_app(config_class=Config):
         )
 
     @app.route("/api/v1/teams/<int:team_id>", methods=["PUT"])
-    @app.route("/api/teams/<int:team_id>", methods=["PUT"])  # Backward compatibility
     @with_session
     def update_team(session, team_id):
         """Update a team"""
@@ -324,43 +497,51 @@ def create_app(config_class=Config):
             return jsonify({"error": "Validation failed", "details": errors}), 422
 
         update_data = validated.model_dump(exclude_unset=True)
-        repo = TeamRepository(session)
+        repo = g.repos.teams
         team = repo.update(team_id, **update_data)
 
         if not team:
             return jsonify({"error": "Team not found"}), 404
 
+        response_cache.delete(*metrics_cache_keys(team_id))
         return jsonify({"id": team.id, "name": team.name, "description": team.description})
 
     @app.route("/api/v1/teams/<int:team_id>", methods=["DELETE"])
-    @app.route("/api/teams/<int:team_id>", methods=["DELETE"])  # Backward compatibility
     @with_session
     def delete_team(session, team_id):
         """Delete a team"""
-        repo = TeamRepository(session)
+        repo = g.repos.teams
         success = repo.delete(team_id)
 
         if not success:
             return jsonify({"error": "Team not found"}), 404
 
+        response_cache.delete(*metrics_cache_keys(team_id))
         return jsonify({"message": "Team deleted successfully"})
 
     # ==================== Team Member Endpoints ====================
 
     @app.route("/api/v1/members", methods=["GET"])
-    @app.route("/api/members", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_members(session):
         """Get all members, optionally filtered by team"""
         team_id = request.args.get("team_id", type=int)
-        repo = TeamMemberRepository(session)
+        repo = g.repos.members
+        next_url = None
 
         if team_id:
             members = repo.get_by_team(team_id)
+        elif "limit" in request.args or "after_id" in request.args:
+            # Opt-in paging by id; a full page links to the next one
+            limit = max(1, min(1000, request.args.get("limit", type=int, default=100)))
+            after_id = request.args.get("after_id", type=int, default=0)
+            members = repo.get_all(limit=limit, after_id=after_id)
+            if len(members) == limit:
+                next_url = f"/api/v1/members?limit={limit}&after_id={members[-1].id}"
         else:
             members = repo.get_all()
 
-        return jsonify(
+        response = jsonify(
             [
                 {
                     "id": m.id,
@@ -373,9 +554,11 @@ def create_app(config_class=Config):
                 for m in members
             ]
         )
+        if next_url:
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return response
 
     @app.route("/api/v1/members", methods=["POST"])
-    @app.route("/api/members", methods=["POST"])  # Backward compatibility
     @with_session
     def create_member(session):
         """Create a new team member"""
@@ -385,7 +568,7 @@ def create_app(config_class=Config):
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
 
-        repo = TeamMemberRepository(session)
+        repo = g.repos.members
         member = repo.create(
             name=validated.name,
             email=validated.email,
@@ -407,11 +590,10 @@ def create_app(config_class=Config):
         )
 
     @app.route("/api/v1/members/<int:member_id>", methods=["DELETE"])
-    @app.route("/api/members/<int:member_id>", methods=["DELETE"])  # Backward compatibility
     @with_session
     def delete_member(session, member_id):
         """Delete a team member"""
-        repo = TeamMemberRepository(session)
+        repo = g.repos.members
         success = repo.delete(member_id)
 
         if not success:
@@ -422,23 +604,22 @@ def create_app(config_class=Config):
     # ==================== Communication Endpoints ====================
 
     @app.route("/api/v1/communications", methods=["GET"])
-    @app.route("/api/communications", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_communications(session):
         """Get communications, optionally filtered"""
         team_id = request.args.get("team_id", type=int)
         member_id = request.args.get("member_id", type=int)
-        days = request.args.get("days", type=int, default=30)
-
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+        window, errors = date_window_from_args()
+        if errors:
+            return jsonify({"error": "Validation failed", "details": errors}), 422
+        start_date, end_date = window
 
-        repo = CommunicationRepository(session)
+        repo = g.repos.communications
 
         if member_id:
-            comms = repo.get_by_member(member_id, start_date, end_date)
+            comms = repo.get_rows_by_member(member_id, start_date, end_date)
         elif team_id:
-            comms = repo.get_by_team(team_id, start_date, end_date)
+            comms = repo.get_rows_by_team(team_id, start_date, end_date)
         else:
             return jsonify({"error": "team_id or member_id required"}), 400
 
@@ -452,8 +633,8 @@ def create_app(config_class=Config):
                     "team_id": c.team_id,
                     "type": c.communication_type,
                     "duration_minutes": c.duration_minutes,
-                    "is_group": bool(c.is_group_communication),
-                    "is_cross_team": bool(c.is_cross_team),
+                    "is_group": c.is_group_communication,
+                    "is_cross_team": c.is_cross_team,
                     "timestamp": c.timestamp.isoformat(),
                 }
                 for c in comms
@@ -461,7 +642,6 @@ def create_app(config_class=Config):
         )
 
     @app.route("/api/v1/communications", methods=["POST"])
-    @app.route("/api/communications", methods=["POST"])  # Backward compatibility
     @with_session
     def create_communication(session):
         """Record a new communication event"""
@@ -471,15 +651,15 @@ def create_app(config_class=Config):
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
 
-        repo = CommunicationRepository(session)
+        repo = g.repos.communications
         comm = repo.create(
             sender_id=validated.sender_id,
             team_id=validated.team_id,
             communication_type=validated.communication_type,
             receiver_id=validated.receiver_id,
             duration_minutes=validated.duration_minutes,
-            is_group_communication=1 if validated.is_group else 0,
-            is_cross_team=1 if validated.is_cross_team else 0,
+            is_group_communication=validated.is_group,
+            is_cross_team=validated.is_cross_team,
             message_content=validated.message_content,
         )
 
@@ -498,7 +678,6 @@ def create_app(config_class=Config):
         )
 
     @app.route("/api/v1/communications/bulk", methods=["POST"])
-    @app.route("/api/communications/bulk", methods=["POST"])  # Backward compatibility
     @limiter.limit(_limit_bulk)
     @with_session
     def create_bulk_communications(session):
@@ -510,46 +689,38 @@ def create_app(config_class=Config):
         communications_data = data["communications"]
         
         # Validate array size
-        from .config import ValidationConstants
         if len(communications_data) > ValidationConstants.MAX_BULK_COMMUNICATIONS:
             return jsonify({
                 "error": "Too many communications",
                 "detail": f"Maximum {ValidationConstants.MAX_BULK_COMMUNICATIONS} communications per request"
             }), 400
 
-        # Validate each communication
-        errors = []
-        for idx, comm_data in enumerate(communications_data):
-            validated, validation_errors = validate_request(CommunicationCreate, comm_data)
-            if validation_errors:
-                errors.append({
-                    "index": idx,
-                    "errors": validation_errors
-                })
-        
+        # Validate each communication once and keep the parsed models for the insert pass
+        validated_list, errors = validate_many(CommunicationCreate, communications_data)
+
         if errors:
             return jsonify({
                 "error": "Validation failed",
                 "details": errors
             }), 422
 
-        # Create all communications
-        repo = CommunicationRepository(session)
-        created = []
-
-        for comm_data in communications_data:
-            validated, _ = validate_request(CommunicationCreate, comm_data)
-            comm = repo.create(
-                sender_id=validated.sender_id,
-                team_id=validated.team_id,
-                communication_type=validated.communication_type,
-                receiver_id=validated.receiver_id,
-                duration_minutes=validated.duration_minutes,
-                is_group_communication=1 if validated.is_group else 0,
-                is_cross_team=1 if validated.is_cross_team else 0,
-                message_content=validated.message_content,
-            )
-            created.append(comm.id)
+        # Create all communications in a single batched INSERT
+        repo = g.repos.communications
+        created = repo.bulk_create(
+            [
+                {
+                    "sender_id": validated.sender_id,
+                    "team_id": validated.team_id,
+                    "communication_type": validated.communication_type,
+                    "receiver_id": validated.receiver_id,
+                    "duration_minutes": validated.duration_minutes,
+                    "is_group_communication": validated.is_group,
+                    "is_cross_team": validated.is_cross_team,
+                    "message_content": validated.message_content,
+                }
+                for validated in validated_list
+            ]
+        )
 
         app.logger.info(f"Bulk created {len(created)} communications")
         return jsonify({"message": f"Created {len(created)} communications", "ids": created}), 201
@@ -557,7 +728,6 @@ def create_app(config_class=Config):
     # ==================== Metrics & Analysis Endpoints ====================
 
     @app.route("/api/v1/calculate/<int:team_id>", methods=["POST"])
-    @app.route("/api/calculate/<int:team_id>", methods=["POST"])  # Backward compatibility
     @limiter.limit(_limit_calculate)
     @with_session
     def calculate_metrics(session, team_id):
@@ -570,26 +740,72 @@ def create_app(config_class=Config):
         end_date = validated.end_date or datetime.now(timezone.utc)
         start_date = validated.start_date or (end_date - timedelta(days=validated.days or 30))
 
+        if request.args.get("async", "false").lower() in ("1", "true", "yes"):
+            job_id = job_runner.submit(run_calculation, team_id, start_date, end_date)
+            body = {
+                "job_id": job_id,
+                "status": "queued",
+                "metrics_url": f"/api/v1/metrics/{team_id}",
+            }
+            # Without Redis only this process knows the job, and another worker
+            # may answer the poll; clients then watch metrics_url instead
+            if job_runner.shared:
+                body["status_url"] = f"/api/v1/calculate/status/{job_id}"
+            return jsonify(body), 202
+
         calculator = ThreeEsCalculator(session)
         results = calculator.calculate_all_metrics(
             team_id=team_id, start_date=start_date, end_date=end_date, save_to_db=True
         )
+        response_cache.delete(*metrics_cache_keys(team_id))
 
-        return jsonify(results)
+        return jsonify(_serialize_metrics(results))
+
+    def run_calculation(team_id, start_date, end_date):
+        """Background job body: calculate and persist metrics in a dedicated session"""
+        session = session_factory()
+        try:
+            results = ThreeEsCalculator(session).calculate_all_metrics(
+                team_id=team_id, start_date=start_date, end_date=end_date, save_to_db=True
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        response_cache.delete(*metrics_cache_keys(team_id))
+        return _serialize_metrics(results)
+
+    @app.route("/api/v1/calculate/status/<job_id>", methods=["GET"])
+    def calculation_status(job_id):
+        """Poll an asynchronous calculation started with POST /calculate/<team_id>?async=true"""
+        job = job_runner.status(job_id)
+        if job is None:
+            return jsonify({"error": "Job not found"}), 404
+        if job["status"] == JOB_FAILED:
+            # The exception is in the server log; its text may expose internals
+            job["error"] = "Calculation failed"
+        return jsonify(job)
 
     @app.route("/api/v1/metrics/<int:team_id>", methods=["GET"])
-    @app.route("/api/metrics/<int:team_id>", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_team_metrics(session, team_id):
         """Get latest metrics for a team"""
-        repo = TeamMetricsRepository(session)
+        cache_key = f"metrics:team:{team_id}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_json(cached)
+
+        repo = g.repos.metrics
         metrics = repo.get_latest_by_team(team_id)
 
         if not metrics:
             return jsonify({"error": "No metrics found for this team"}), 404
 
-        return jsonify(
-            {
+        return cached_json(
+            cache_key,
+            _serialize_metrics({
                 "team_id": metrics.team_id,
                 "energy_score": metrics.energy_score,
                 "engagement_score": metrics.engagement_score,
@@ -600,21 +816,20 @@ def create_app(config_class=Config):
                 "period_start": metrics.calculation_period_start.isoformat(),
                 "period_end": metrics.calculation_period_end.isoformat(),
                 "calculated_at": metrics.calculated_at.isoformat(),
-            }
+            }),
         )
 
     @app.route("/api/v1/metrics/<int:team_id>/history", methods=["GET"])
-    @app.route("/api/metrics/<int:team_id>/history", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_metrics_history(session, team_id):
         """Get metrics history for a team"""
         raw_limit = request.args.get("limit", type=int, default=10)
         limit = max(1, min(100, raw_limit)) if raw_limit is not None else 10
-        repo = TeamMetricsRepository(session)
+        repo = g.repos.metrics
         metrics_list = repo.get_by_team(team_id, limit=limit)
 
         return jsonify(
-            [
+            _serialize_metrics([
                 {
                     "energy_score": m.energy_score,
                     "engagement_score": m.engagement_score,
@@ -623,19 +838,23 @@ def create_app(config_class=Config):
                     "calculated_at": m.calculated_at.isoformat(),
                 }
                 for m in metrics_list
-            ]
+            ])
         )
 
     @app.route("/api/v1/metrics/all", methods=["GET"])
-    @app.route("/api/metrics/all", methods=["GET"])  # Backward compatibility
-    @with_session
+    @with_read_session
     def get_all_metrics(session):
         """Get latest metrics for all teams"""
-        repo = TeamMetricsRepository(session)
+        cached = response_cache.get("metrics:all")
+        if cached is not None:
+            return conditional_json(cached)
+
+        repo = g.repos.metrics
         metrics_list = repo.get_all_latest()
 
-        return jsonify(
-            [
+        return cached_json(
+            "metrics:all",
+            _serialize_metrics([
                 {
                     "team_id": m.team_id,
                     "team_name": m.team.name if m.team else None,
@@ -646,43 +865,33 @@ def create_app(config_class=Config):
                     "calculated_at": m.calculated_at.isoformat(),
                 }
                 for m in metrics_list
-            ]
+            ]),
         )
 
     @app.route("/api/v1/network/<int:team_id>", methods=["GET"])
-    @app.route("/api/network/<int:team_id>", methods=["GET"])  # Backward compatibility
     @limiter.limit(_limit_network)
-    @with_session
+    @with_read_session
     def analyze_network(session, team_id):
         """Analyze team communication network"""
-        params, errors = validate_request(
-            NetworkAnalysisParams, {"days": request.args.get("days", type=int, default=30)}
-        )
+        window, errors = date_window_from_args()
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
-        days = params.days or 30
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = window
 
         analyzer = NetworkAnalyzer(session)
         network_metrics = analyzer.analyze_network_metrics(team_id, start_date, end_date)
 
-        return jsonify(network_metrics)
+        return conditional_json(json_bytes(network_metrics))
 
     @app.route("/api/v1/network/<int:team_id>/communities", methods=["GET"])
-    @app.route("/api/network/<int:team_id>/communities", methods=["GET"])  # Backward compatibility
     @limiter.limit(_limit_network)
-    @with_session
+    @with_read_session
     def detect_communities(session, team_id):
         """Detect sub-communities and potential silos within the team"""
-        params, errors = validate_request(
-            NetworkAnalysisParams, {"days": request.args.get("days", type=int, default=30)}
-        )
+        window, errors = date_window_from_args()
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
-        days = params.days or 30
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = window
 
         analyzer = NetworkAnalyzer(session)
         communities = analyzer.detect_communities(team_id, start_date, end_date)
@@ -690,19 +899,14 @@ def create_app(config_class=Config):
         return jsonify(communities)
 
     @app.route("/api/v1/network/<int:team_id>/centrality", methods=["GET"])
-    @app.route("/api/network/<int:team_id>/centrality", methods=["GET"])  # Backward compatibility
     @limiter.limit(_limit_network)
-    @with_session
+    @with_read_session
     def analyze_centrality(session, team_id):
         """Calculate advanced centrality metrics to identify key players"""
-        params, errors = validate_request(
-            NetworkAnalysisParams, {"days": request.args.get("days", type=int, default=30)}
-        )
+        window, errors = date_window_from_args()
         if errors:
             return jsonify({"error": "Validation failed", "details": errors}), 422
-        days = params.days or 30
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = window
 
         analyzer = NetworkAnalyzer(session)
         centrality = analyzer.calculate_advanced_centrality(team_id, start_date, end_date)
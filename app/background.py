@@ -0,0 +1,125 @@
+"""
+Background job runner.
+
+Lets slow endpoints (metrics calculation) return ``202 Accepted`` immediately
+and run the work on a small thread pool. Job records are kept in Redis when a
+URL is configured and the ``redis`` package is installed, so any worker can
+report a job's status; otherwise they live in the process that accepted the
+job. Results that matter are persisted to the database by the job itself, so
+clients can also poll the regular read endpoints.
+"""
+
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobRunner:
+    """Run callables on a thread pool and track their status by job id"""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_retained: int = 1000,
+        redis_url: Optional[str] = None,
+        ttl: int = 86400,
+        prefix: str = "orgnet:job:",
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="orgnet-job"
+        )
+        self._jobs: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_retained = max_retained
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = None
+        if redis_url and redis is not None:
+            self._redis = redis.Redis.from_url(redis_url, socket_connect_timeout=1)
+
+    @property
+    def shared(self) -> bool:
+        """True when job records are in Redis, i.e. visible to every worker process"""
+        return self._redis is not None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> str:
+        """Queue ``fn(*args, **kwargs)`` and return its job id"""
+        job_id = uuid.uuid4().hex
+        self._store(job_id, {"job_id": job_id, "status": JOB_QUEUED})
+        self._executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        """Return a copy of the job record, or None if unknown/evicted"""
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self.prefix + job_id)
+            except redis.RedisError as e:
+                logger.warning(f"Job status read failed for {job_id}: {e}")
+                return None
+            return json.loads(raw) if raw is not None else None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id: str, fn: Callable, args: tuple, kwargs: dict) -> None:
+        self._update(job_id, status=JOB_RUNNING)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Background job {job_id} failed: {e}", exc_info=True)
+            self._update(job_id, status=JOB_FAILED, error=str(e))
+        else:
+            self._update(job_id, status=JOB_SUCCEEDED, result=result)
+
+    def _store(self, job_id: str, job: Dict) -> None:
+        if self._redis is not None:
+            try:
+                self._redis.setex(self.prefix + job_id, self.ttl, json.dumps(job, default=str))
+            except redis.RedisError as e:
+                logger.warning(f"Job status write failed for {job_id}: {e}")
+            return
+        with self._lock:
+            self._jobs[job_id] = job
+            self._trim()
+
+    def _update(self, job_id: str, **fields) -> None:
+        if self._redis is not None:
+            # Only the job's own thread writes after submit(), so read-modify-write is safe
+            job = self.status(job_id)
+            if job is not None:
+                job.update(fields)
+                self._store(job_id, job)
+            return
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _trim(self) -> None:
+        # Evict the oldest finished jobs once the registry grows past the cap
+        excess = len(self._jobs) - self._max_retained
+        if excess <= 0:
+            return
+        for job_id in [
+            jid for jid, job in self._jobs.items() if job["status"] in (JOB_SUCCEEDED, JOB_FAILED)
+        ][:excess]:
+            del self._jobs[job_id]
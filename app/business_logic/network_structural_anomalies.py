@@ -82,7 +82,7 @@ def detect_team_network_structural_anomalies(
     member_repo = TeamMemberRepository(session)
     comm_repo = CommunicationRepository(session)
     members = member_repo.get_by_team(team_id)
-    comms = comm_repo.get_by_team(team_id, start_date, end_date)
+    dyads = comm_repo.get_dyads_by_team(team_id, start_date, end_date)
 
     member_ids = [m.id for m in members]
     names = {m.id: m.name for m in members}
@@ -99,14 +99,8 @@ def detect_team_network_structural_anomalies(
             "members": [],
         }
 
-    rows: List[Dict[str, Any]] = []
-    for c in comms:
-        rid = getattr(c, "receiver_id", None)
-        if rid is None:
-            continue
-        rows.append({"sender_id": c.sender_id, "receiver_id": rid})
-
-    df = pd.DataFrame(rows)
+    # Rows without a receiver (broadcasts) are already excluded by the query
+    df = pd.DataFrame(dyads, columns=["sender_id", "receiver_id"])
     if df.empty:
         edges = pd.DataFrame(columns=["u", "v", "weight"])
     else:
@@ -156,7 +150,7 @@ def detect_team_network_structural_anomalies(
         "status": "ok",
         "period": {"start": start_date.isoformat(), "end": end_date.isoformat()},
         "n_members": len(member_ids),
-        "n_communication_rows": len(rows),
+        "n_communication_rows": len(df),
         "n_edges": int(len(edges)),
         "quantile": float(quantile),
         "n_flagged": int(scored["flag"].sum()),
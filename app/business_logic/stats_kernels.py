@@ -0,0 +1,40 @@
+"""
+Numeric kernels for post-query aggregation.
+
+Operate on contiguous NumPy column arrays (ids, counts, durations). Loops are compiled
+with Numba when it is installed (``speedups`` extra) and fall back to NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit
+    def _counts_per_index(indices: np.ndarray, n: int) -> np.ndarray:
+        out = np.zeros(n, np.int64)
+        for i in range(indices.size):
+            out[indices[i]] += 1
+        return out
+
+else:
+
+    def _counts_per_index(indices: np.ndarray, n: int) -> np.ndarray:
+        return np.bincount(indices, minlength=n).astype(np.int64, copy=False)
+
+
+def counts_per_index(indices: np.ndarray, n: int) -> np.ndarray:
+    """
+    Occurrences of each index in ``0..n-1`` (e.g. messages per sender index).
+
+    ``indices`` must already be mapped into ``range(n)``.
+    """
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64)
+    return _counts_per_index(np.ascontiguousarray(indices, dtype=np.int64), n)
+
@@ -7,6 +7,7 @@ Pure math lives in netsmith.ona — this layer owns ORM access and persistence.
 """
 
 import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
@@ -14,13 +15,18 @@ import networkx as nx
 import numpy as np
 from sqlalchemy.orm import Session
 
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
 from netsmith.api.compute import communities as ns_communities
 from netsmith.api.compute import degree as ns_degree
 from netsmith.api.compute import pagerank as ns_pagerank
 from netsmith.engine.contracts import EdgeList
 from netsmith.ona import Communication as NsComm
 from netsmith.ona import detect_silos, score_team
-from netsmith.ona.three_es import gini_coefficient
+from netsmith.ona.three_es import gini_coefficient, overall_score
 
 from ..data_access.repositories import (
     CommunicationRepository,
@@ -29,14 +35,28 @@ from ..data_access.repositories import (
     TeamRepository,
 )
 from ..database.models import Communication, Team, TeamMember
+from .stats_kernels import counts_per_index
 
 logger = logging.getLogger(__name__)
 
+# Community interpretations by modularity band (strictly above 0.3 / 0.5), ascending
+_MODULARITY_BOUNDS = (0.3, 0.5)
+_COMMUNITY_INTERPRETATIONS = (
+    "Team has {n} informal groupings with excellent cross-communication (modularity {m:.2f}).",
+    "Team has {n} sub-groups with good cross-communication (modularity {m:.2f}).",
+    "⚠️ Warning: {n} distinct silos (modularity {m:.2f}). Consider cross-group activities.",
+)
+
 
 # ── ORM → netsmith.ona adapter ────────────────────────────────────────────────
 
 def _to_ns_comms(orm_comms: List[Communication]) -> List[NsComm]:
-    """Convert SQLAlchemy Communication rows to netsmith.ona.Communication dataclasses."""
+    """
+    Convert Communication objects to netsmith.ona.Communication dataclasses.
+
+    Accepts ORM instances or the column rows from
+    ``CommunicationRepository.get_scoring_rows`` (same attribute names).
+    """
     return [
         NsComm(
             sender_id=c.sender_id,
@@ -49,6 +69,92 @@ def _to_ns_comms(orm_comms: List[Communication]) -> List[NsComm]:
     ]
 
 
+def _sorted_member_ids(members: list) -> np.ndarray:
+    """Member ids in ascending order; node index i is the i-th smallest id."""
+    return np.array(sorted({m.id for m in members}), dtype=np.int64)
+
+
+def _undirected_pair_counts(
+    member_ids: np.ndarray, pairs: list
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map SQL pair counts onto member indices with masked array ops.
+
+    ``pairs`` are ``(low_id, high_id, n)`` rows from
+    ``CommunicationRepository.get_pair_counts``; ``member_ids`` must be sorted.
+    Pairs with an endpoint outside ``member_ids`` are dropped. Returns
+    ``(u, v, counts)`` where ``u <= v`` are indices into ``member_ids``.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    if not pairs or not member_ids.size:
+        return empty, empty, empty
+    rows = np.array(pairs, dtype=np.int64)
+    keep = np.isin(rows[:, 0], member_ids) & np.isin(rows[:, 1], member_ids)
+    # ids are sorted, so low_id <= high_id carries over to the indices
+    u = np.searchsorted(member_ids, rows[keep, 0])
+    v = np.searchsorted(member_ids, rows[keep, 1])
+    return u, v, rows[keep, 2]
+
+
+def _to_igraph(G: nx.Graph, weight: Optional[str] = None) -> tuple[list, "igraph.Graph"]:
+    """
+    igraph copy of ``G``; vertex i is ``nodes[i]``.
+
+    The edge attribute ``weight`` is copied when given.
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = [(index[u], index[v]) for u, v in G.edges()]
+    g = igraph.Graph(n=len(nodes), edges=edges, directed=False)
+    if weight is not None:
+        g.es[weight] = [w for _, _, w in G.edges(data=weight, default=1)]
+    return nodes, g
+
+
+def _betweenness_centrality(G: nx.Graph) -> Dict:
+    """
+    Normalized betweenness, matching ``nx.betweenness_centrality(G)``.
+
+    Native when igraph is installed.
+    """
+    if igraph is None:
+        return nx.betweenness_centrality(G)
+    nodes, g = _to_igraph(G)
+    n = len(nodes)
+    scale = 2.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    return {node: b * scale for node, b in zip(nodes, g.betweenness(directed=False), strict=True)}
+
+
+def _closeness_centrality(G: nx.Graph) -> Dict:
+    """
+    Closeness matching ``nx.closeness_centrality(G)``.
+
+    Uses Wasserman-Faust scaling for disconnected graphs, like networkx.
+    """
+    if igraph is None:
+        return nx.closeness_centrality(G)
+    nodes, g = _to_igraph(G)
+    n = len(nodes)
+    membership = g.connected_components().membership
+    labels = np.asarray(membership, dtype=np.int64)
+    sizes = counts_per_index(labels, int(labels.max()) + 1 if labels.size else 0)
+    result = {}
+    for node, c, comp in zip(nodes, g.closeness(normalized=True), membership, strict=True):
+        reachable = int(sizes[comp]) - 1
+        result[node] = c * reachable / (n - 1) if reachable > 0 else 0.0
+    return result
+
+
+def _modularity(G: nx.Graph, communities: List[List]) -> float:
+    """Weighted modularity of a node partition; native when igraph is installed."""
+    if igraph is None:
+        from networkx.algorithms.community import modularity as nx_modularity
+        return nx_modularity(G, [set(c) for c in communities])
+    nodes, g = _to_igraph(G, weight="weight")
+    label = {node: i for i, members in enumerate(communities) for node in members}
+    return g.modularity([label[node] for node in nodes], weights="weight")
+
+
 # ── ThreeEsCalculator ─────────────────────────────────────────────────────────
 
 class ThreeEsCalculator:
@@ -66,21 +172,44 @@ class ThreeEsCalculator:
         self.comm_repo = CommunicationRepository(session)
         self.metrics_repo = TeamMetricsRepository(session)
 
+    def _load_team_data(
+        self,
+        team_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        communications: Optional[List[Communication]] = None,
+        members: Optional[List[TeamMember]] = None,
+    ) -> tuple[List[int], List[Communication]]:
+        """Return (member_ids, communications), querying only what the caller didn't pass in."""
+        if members is None:
+            member_ids = self.member_repo.get_member_ids_array(team_id).tolist()
+        else:
+            member_ids = [m.id for m in members]
+        if communications is None:
+            communications = self.comm_repo.get_scoring_rows(team_id, start_date, end_date)
+        return member_ids, communications
+
     # ── Individual E calculators (kept for API compatibility) ─────────────────
     # Key names are mapped back to the original API contract so callers don't break.
 
     def calculate_energy(
-        self, team_id: int, start_date: datetime, end_date: datetime
+        self,
+        team_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        communications: Optional[List[Communication]] = None,
+        members: Optional[List[TeamMember]] = None,
     ) -> Dict:
         from netsmith.ona.three_es import energy_score as _energy
-        members = self.member_repo.get_by_team(team_id)
-        comms = self.comm_repo.get_by_team(team_id, start_date, end_date)
+        member_ids, comms = self._load_team_data(
+            team_id, start_date, end_date, communications, members
+        )
         days = max((end_date - start_date).days, 1)
-        score, d = _energy(_to_ns_comms(comms), [m.id for m in members], days)
+        score, d = _energy(_to_ns_comms(comms), member_ids, days)
         return {
             "energy_score": score,
             "total_communications": d["total_comms"],
-            "avg_communications_per_member": round(d["total_comms"] / max(len(members), 1), 2),
+            "avg_communications_per_member": d["total_comms"] / max(len(member_ids), 1),
             "total_duration_minutes": d["total_duration_min"],
             "face_to_face_ratio": d["face_to_face_ratio"],
             "frequency_normalized": d.get("freq_normalized", 0.0),
@@ -88,12 +217,18 @@ class ThreeEsCalculator:
         }
 
     def calculate_engagement(
-        self, team_id: int, start_date: datetime, end_date: datetime
+        self,
+        team_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        communications: Optional[List[Communication]] = None,
+        members: Optional[List[TeamMember]] = None,
     ) -> Dict:
         from netsmith.ona.three_es import engagement_score as _engagement
-        members = self.member_repo.get_by_team(team_id)
-        comms = self.comm_repo.get_by_team(team_id, start_date, end_date)
-        score, d = _engagement(_to_ns_comms(comms), [m.id for m in members])
+        member_ids, comms = self._load_team_data(
+            team_id, start_date, end_date, communications, members
+        )
+        score, d = _engagement(_to_ns_comms(comms), member_ids)
         return {
             "engagement_score": score,
             "participation_rate": d["participation_rate"],
@@ -103,12 +238,18 @@ class ThreeEsCalculator:
         }
 
     def calculate_exploration(
-        self, team_id: int, start_date: datetime, end_date: datetime
+        self,
+        team_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        communications: Optional[List[Communication]] = None,
+        members: Optional[List[TeamMember]] = None,
     ) -> Dict:
         from netsmith.ona.three_es import exploration_score as _exploration
-        members = self.member_repo.get_by_team(team_id)
-        comms = self.comm_repo.get_by_team(team_id, start_date, end_date)
-        score, d = _exploration(_to_ns_comms(comms), [m.id for m in members])
+        member_ids, comms = self._load_team_data(
+            team_id, start_date, end_date, communications, members
+        )
+        score, d = _exploration(_to_ns_comms(comms), member_ids)
         return {
             "exploration_score": score,
             "cross_team_communications": d["cross_team_count"],
@@ -120,7 +261,6 @@ class ThreeEsCalculator:
     def calculate_overall_performance(
         self, energy: float, engagement: float, exploration: float
     ) -> float:
-        from netsmith.ona.three_es import overall_score
         return overall_score(energy, engagement, exploration)
 
     def _calculate_gini_coefficient(self, values: List[float]) -> float:
@@ -135,19 +275,18 @@ class ThreeEsCalculator:
         end_date: datetime = None,
         save_to_db: bool = True,
     ) -> Dict:
+        now = datetime.now(timezone.utc)
         if end_date is None:
-            end_date = datetime.now(timezone.utc)
+            end_date = now
         if start_date is None:
             start_date = end_date - timedelta(days=30)
 
-        members = self.member_repo.get_by_team(team_id)
-        comms = self.comm_repo.get_by_team(team_id, start_date, end_date)
+        member_ids, comms = self._load_team_data(team_id, start_date, end_date)
         days = max((end_date - start_date).days, 1)
 
-        result = score_team(_to_ns_comms(comms), [m.id for m in members], days)
+        result = score_team(_to_ns_comms(comms), member_ids, days)
 
         if save_to_db:
-            stats = self.comm_repo.get_communication_stats(team_id, start_date, end_date)
             self.metrics_repo.create(
                 team_id=team_id,
                 energy_score=result.energy,
@@ -156,7 +295,8 @@ class ThreeEsCalculator:
                 overall_score=result.overall,
                 calculation_period_start=start_date,
                 calculation_period_end=end_date,
-                total_communications=stats["total_communications"],
+                # Same team/window filter as get_communication_stats, without re-querying
+                total_communications=len(comms),
                 participation_rate=result.detail["engagement"].get("participation_rate", 0.0),
                 gini_coefficient=result.detail["engagement"].get("gini", 0.0),
             )
@@ -172,7 +312,7 @@ class ThreeEsCalculator:
             "engagement":  {"engagement_score":  result.engagement,  **result.detail["engagement"]},
             "exploration": {"exploration_score": result.exploration, **result.detail["exploration"]},
             "overall_score": result.overall,
-            "calculated_at": datetime.now(timezone.utc).isoformat(),
+            "calculated_at": now.isoformat(),
         }
 
 
@@ -187,58 +327,67 @@ class NetworkAnalyzer:
         self.session = session
         self.comm_repo = CommunicationRepository(session)
         self.member_repo = TeamMemberRepository(session)
+        # Per-analyzer memo keyed by (team_id, start_date, end_date), so callers running
+        # several analyses on one window query and build the graph only once.
+        self._data_cache: dict[tuple, tuple[list, list, dict[int, dict]]] = {}
+        self._graph_cache: dict[tuple, nx.Graph] = {}
 
     # ── Internal builders ─────────────────────────────────────────────────────
 
     def _load_data(
         self, team_id: int, start_date: datetime, end_date: datetime
     ) -> tuple[list, list, dict[int, dict]]:
-        """Return (members, communications, node_meta) for a team + window."""
-        members = self.member_repo.get_by_team(team_id)
-        comms = self.comm_repo.get_by_team(team_id, start_date, end_date)
-        node_meta = {m.id: {"name": m.name, "role": m.role} for m in members}
-        return members, comms, node_meta
+        """Return (members, pair_counts, node_meta) for a team + window."""
+        key = (team_id, start_date, end_date)
+        if key not in self._data_cache:
+            members = self.member_repo.get_by_team(team_id)
+            pairs = self.comm_repo.get_pair_counts(team_id, start_date, end_date)
+            node_meta = {m.id: {"name": m.name, "role": m.role} for m in members}
+            self._data_cache[key] = (members, pairs, node_meta)
+        return self._data_cache[key]
+
+    def _graph(self, team_id: int, start_date: datetime, end_date: datetime) -> nx.Graph:
+        """Return the (memoized) NetworkX graph for a team + window."""
+        key = (team_id, start_date, end_date)
+        if key not in self._graph_cache:
+            members, pairs, _ = self._load_data(team_id, start_date, end_date)
+            self._graph_cache[key] = self._to_nx(members, pairs)
+        return self._graph_cache[key]
+
+    def clear_cache(self) -> None:
+        """Drop memoized data and graphs (e.g. after new communications are recorded)."""
+        self._data_cache.clear()
+        self._graph_cache.clear()
 
     def _to_edge_list(
-        self, members: list, comms: list
+        self, members: list, pairs: list
     ) -> tuple[EdgeList | None, dict[int, int], dict[int, int]]:
         """
-        Build a netsmith EdgeList from ORM objects.
+        Build a netsmith EdgeList from members and SQL pair counts.
 
         Returns (EdgeList | None, id_to_idx, idx_to_id).
         None when there are no edges.
         """
-        member_set = {m.id for m in members}
-        id_to_idx = {mid: i for i, mid in enumerate(sorted(member_set))}
+        member_ids = _sorted_member_ids(members)
+        id_to_idx = {int(mid): i for i, mid in enumerate(member_ids)}
         idx_to_id = {i: mid for mid, i in id_to_idx.items()}
 
-        edge_weights: dict[tuple[int, int], int] = {}
-        for c in comms:
-            if c.receiver_id and c.receiver_id in member_set:
-                a, b = id_to_idx[c.sender_id], id_to_idx[c.receiver_id]
-                key = (min(a, b), max(a, b))  # canonical undirected key
-                edge_weights[key] = edge_weights.get(key, 0) + 1
-
-        if not edge_weights:
+        u, v, counts = _undirected_pair_counts(member_ids, pairs)
+        if not counts.size:
             return None, id_to_idx, idx_to_id
-
-        u = np.array([k[0] for k in edge_weights], dtype=np.int64)
-        v = np.array([k[1] for k in edge_weights], dtype=np.int64)
-        w = np.array(list(edge_weights.values()), dtype=np.float64)
+        w = counts.astype(np.float64)
         return EdgeList(u=u, v=v, w=w, directed=False, n_nodes=len(members)), id_to_idx, idx_to_id
 
-    def _to_nx(self, members: list, comms: list) -> nx.Graph:
+    def _to_nx(self, members: list, pairs: list) -> nx.Graph:
         """Build a NetworkX graph (used only for betweenness/eigenvector)."""
-        member_set = {m.id for m in members}
         G = nx.Graph()
         for m in members:
             G.add_node(m.id, name=m.name, role=m.role)
-        for c in comms:
-            if c.receiver_id and c.receiver_id in member_set:
-                if G.has_edge(c.sender_id, c.receiver_id):
-                    G[c.sender_id][c.receiver_id]["weight"] += 1
-                else:
-                    G.add_edge(c.sender_id, c.receiver_id, weight=1)
+        member_ids = _sorted_member_ids(members)
+        u, v, counts = _undirected_pair_counts(member_ids, pairs)
+        G.add_weighted_edges_from(
+            zip(member_ids[u].tolist(), member_ids[v].tolist(), counts.tolist(), strict=True)
+        )
         return G
 
     # ── Public API ────────────────────────────────────────────────────────────
@@ -247,17 +396,16 @@ class NetworkAnalyzer:
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> nx.Graph:
         """Return a NetworkX graph of member communications (legacy public API)."""
-        members, comms, _ = self._load_data(team_id, start_date, end_date)
-        return self._to_nx(members, comms)
+        return self._graph(team_id, start_date, end_date)
 
     def analyze_network_metrics(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> Dict:
-        members, comms, node_meta = self._load_data(team_id, start_date, end_date)
+        members, pairs, node_meta = self._load_data(team_id, start_date, end_date)
         if not members:
             return {"error": "No data available for analysis"}
 
-        el, id_to_idx, idx_to_id = self._to_edge_list(members, comms)
+        el, id_to_idx, idx_to_id = self._to_edge_list(members, pairs)
         n_nodes = len(members)
         n_edges = len(el.u) if el is not None else 0
         density = round((2 * n_edges) / max(n_nodes * (n_nodes - 1), 1), 3)
@@ -270,12 +418,14 @@ class NetworkAnalyzer:
         degrees = ns_degree(el)
 
         # NetworkX: betweenness (not yet in netsmith public API)
-        G = self._to_nx(members, comms)
+        G = self._graph(team_id, start_date, end_date)
         try:
-            betweenness = nx.betweenness_centrality(G)
-            bv = np.array(list(betweenness.values()))
+            betweenness = _betweenness_centrality(G)
+            bv = np.fromiter(betweenness.values(), dtype=np.float64, count=len(betweenness))
+            mean_b = float(bv.mean())
+            threshold = mean_b + float(bv.std())
             most_central = max(betweenness.items(), key=lambda x: x[1])
-            bottlenecks = [n for n, c in betweenness.items() if c > bv.mean() + bv.std()]
+            bottlenecks = [n for n, c in betweenness.items() if c > threshold]
             return {
                 "density": density,
                 "is_connected": nx.is_connected(G),
@@ -285,7 +435,7 @@ class NetworkAnalyzer:
                 "most_central_member_id": most_central[0],
                 "centrality_score": round(most_central[1], 3),
                 "potential_bottlenecks": bottlenecks,
-                "avg_betweenness": round(float(bv.mean()), 3),
+                "avg_betweenness": round(mean_b, 3),
             }
         except (nx.NetworkXError, ValueError) as e:
             return {"density": density, "num_nodes": n_nodes, "num_edges": n_edges,
@@ -295,11 +445,11 @@ class NetworkAnalyzer:
     def detect_communities(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> Dict:
-        members, comms, node_meta = self._load_data(team_id, start_date, end_date)
+        members, pairs, node_meta = self._load_data(team_id, start_date, end_date)
         if len(members) < 3:
             return {"error": "Need at least 3 members for community detection"}
 
-        el, id_to_idx, idx_to_id = self._to_edge_list(members, comms)
+        el, id_to_idx, idx_to_id = self._to_edge_list(members, pairs)
         if el is None:
             return {"error": "No edges — members have not communicated"}
 
@@ -321,12 +471,10 @@ class NetworkAnalyzer:
             for i, member_ids in enumerate(groups.values())
         ]
 
-        # Modularity via NetworkX (netsmith communities() doesn't return it directly)
-        G = self._to_nx(members, comms)
+        # netsmith communities() doesn't return modularity; score the partition separately
+        G = self._graph(team_id, start_date, end_date)
         try:
-            from networkx.algorithms.community import modularity as nx_modularity
-            nx_comms = [set(c["member_ids"]) for c in community_list]
-            mod = round(nx_modularity(G, nx_comms), 3)
+            mod = round(_modularity(G, [c["member_ids"] for c in community_list]), 3)
         except Exception:
             mod = 0.0
 
@@ -341,11 +489,11 @@ class NetworkAnalyzer:
     def calculate_advanced_centrality(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> Dict:
-        members, comms, node_meta = self._load_data(team_id, start_date, end_date)
+        members, pairs, node_meta = self._load_data(team_id, start_date, end_date)
         if not members:
             return {"error": "No data available"}
 
-        el, id_to_idx, idx_to_id = self._to_edge_list(members, comms)
+        el, id_to_idx, idx_to_id = self._to_edge_list(members, pairs)
         if el is None:
             return {"error": "No edges — members have not communicated"}
 
@@ -359,10 +507,10 @@ class NetworkAnalyzer:
         pagerank_cent = {idx_to_id[i]: round(float(pr_scores[i]), 4) for i in range(n)}
 
         # NetworkX: betweenness + eigenvector (not yet in netsmith)
-        G = self._to_nx(members, comms)
+        G = self._graph(team_id, start_date, end_date)
         try:
-            betweenness_cent = nx.betweenness_centrality(G)
-            closeness_cent = nx.closeness_centrality(G)
+            betweenness_cent = _betweenness_centrality(G)
+            closeness_cent = _closeness_centrality(G)
             try:
                 eigenvector_cent = nx.eigenvector_centrality(G, max_iter=1000)
             except (nx.PowerIterationFailedConvergence, nx.NetworkXError):
@@ -396,27 +544,27 @@ class NetworkAnalyzer:
     def _interpret_communities(self, num_communities: int, modularity: float) -> str:
         if num_communities == 1:
             return "Team is well-integrated with no distinct sub-groups."
-        interpretations = [
-            (modularity > 0.5, f"⚠️ Warning: {num_communities} distinct silos (modularity {modularity:.2f}). Consider cross-group activities."),
-            (modularity > 0.3, f"Team has {num_communities} sub-groups with good cross-communication (modularity {modularity:.2f})."),
-            (True,             f"Team has {num_communities} informal groupings with excellent cross-communication (modularity {modularity:.2f})."),
-        ]
-        return next(msg for cond, msg in interpretations if cond)
+        template = _COMMUNITY_INTERPRETATIONS[bisect_left(_MODULARITY_BOUNDS, modularity)]
+        return template.format(n=num_communities, m=modularity)
 
     def _centrality_insights(
         self, degree_cent: Dict, betweenness_cent: Dict, pagerank_cent: Dict
     ) -> List[str]:
         insights = []
-        if betweenness_cent and max(betweenness_cent.values(), default=0) > 0.5:
+        # Materialize each centrality dict once; all checks below are array reductions
+        bv = np.fromiter(betweenness_cent.values(), dtype=np.float64, count=len(betweenness_cent))
+        dv = np.fromiter(degree_cent.values(), dtype=np.float64, count=len(degree_cent))
+        if bv.size and bv.max() > 0.5:
             insights.append("⚠️ Network is highly centralized — consider distributing communication responsibilities")
-        isolated = sum(1 for v in degree_cent.values() if v == 0)
+        isolated = int(np.count_nonzero(dv == 0))
         if isolated:
             insights.append(f"⚠️ {isolated} member(s) are isolated with no connections")
-        bv = np.array(list(betweenness_cent.values())) if betweenness_cent else np.array([])
-        if bv.size > 3 and bv.mean() > 0 and bv.std() / bv.mean() < 0.5:
-            insights.append("✅ Communication responsibility is well-distributed across team")
+        if bv.size > 3:
+            mean_b = bv.mean()
+            if mean_b > 0 and bv.std() / mean_b < 0.5:
+                insights.append("✅ Communication responsibility is well-distributed across team")
         # PageRank concentration check
-        pr = np.array(list(pagerank_cent.values())) if pagerank_cent else np.array([])
+        pr = np.fromiter(pagerank_cent.values(), dtype=np.float64, count=len(pagerank_cent))
         if pr.size > 1 and float(pr.max()) > 3.0 / pr.size:
             insights.append("⚠️ Influence is concentrated — one or few members dominate information flow")
         return insights or ["Network structure appears healthy"]
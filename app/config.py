@@ -4,8 +4,10 @@ Configuration and Constants.
 Centralized configuration to eliminate magic numbers and maintain consistency.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Final, Mapping
 import os
+import sys
 import warnings
 
 # Load .env file if present (python-dotenv)
@@ -42,6 +44,12 @@ class Config:
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///orgnet.db")
 
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
     # Flask settings
     SECRET_KEY = _get_secret_key()
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
@@ -53,8 +61,31 @@ class Config:
     # CORS: use explicit origins in production; * is for development only
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*")
 
-    # Rate limiting
-    RATELIMIT_STORAGE_URL = os.getenv("RATELIMIT_STORAGE_URL", "memory://")
+    # Response compression (used when flask-compress is installed)
+    COMPRESS_MIMETYPES = ["application/json", "text/plain"]
+    COMPRESS_ALGORITHM = ["br", "gzip"]
+    # Streamed bodies (/metrics) only need gzip: Prometheus scrapers never advertise br
+    COMPRESS_ALGORITHM_STREAMING = ["gzip"]
+    COMPRESS_LEVEL = 5
+    COMPRESS_BR_LEVEL = 5
+    COMPRESS_MIN_SIZE = 1024
+
+    # Redis (optional): shared rate-limit counters, response cache and job status
+    REDIS_URL = os.getenv("REDIS_URL")
+
+    # Threads for asynchronous /calculate jobs (per process)
+    BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "2"))
+    # Seconds a job's status is kept in Redis
+    BACKGROUND_JOB_TTL = int(os.getenv("BACKGROUND_JOB_TTL", "86400"))
+
+    # Seconds to cache polled metrics responses (0 disables). Off by default without
+    # Redis: a per-process cache would keep serving old metrics from the other
+    # gunicorn workers after /calculate invalidates it in one of them.
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60" if REDIS_URL else "0"))
+
+    # Rate limiting: memory:// is per-process, so fall back to REDIS_URL when present
+    # to share counters across gunicorn workers.
+    RATELIMIT_STORAGE_URL = os.getenv("RATELIMIT_STORAGE_URL") or REDIS_URL or "memory://"
 
 
 # ============================================================================
@@ -62,29 +93,49 @@ class Config:
 # ============================================================================
 
 
+# Module-level Final ints so hot scoring code (and Numba kernels, which fold module
+# globals as compile-time constants) can use them without an attribute lookup.
+EXCELLENT_THRESHOLD: Final = 80
+GOOD_THRESHOLD: Final = 60
+FAIR_THRESHOLD: Final = 40
+NEEDS_IMPROVEMENT_THRESHOLD: Final = 20
+
+ENERGY_EXCELLENT: Final = 80
+ENERGY_GOOD: Final = 60
+ENERGY_FAIR: Final = 40
+
+ENGAGEMENT_EXCELLENT: Final = 85
+ENGAGEMENT_GOOD: Final = 65
+ENGAGEMENT_FAIR: Final = 45
+
+EXPLORATION_EXCELLENT: Final = 70
+EXPLORATION_GOOD: Final = 50
+EXPLORATION_FAIR: Final = 30
+
+
 class ScoringThresholds:
     """Thresholds for scoring and rating metrics."""
 
     # Rating boundaries (0-100 scale)
-    EXCELLENT_THRESHOLD = 80
-    GOOD_THRESHOLD = 60
-    FAIR_THRESHOLD = 40
-    NEEDS_IMPROVEMENT_THRESHOLD = 20
+    EXCELLENT_THRESHOLD = EXCELLENT_THRESHOLD
+    GOOD_THRESHOLD = GOOD_THRESHOLD
+    FAIR_THRESHOLD = FAIR_THRESHOLD
+    NEEDS_IMPROVEMENT_THRESHOLD = NEEDS_IMPROVEMENT_THRESHOLD
 
     # Energy-specific thresholds
-    ENERGY_EXCELLENT = 80
-    ENERGY_GOOD = 60
-    ENERGY_FAIR = 40
+    ENERGY_EXCELLENT = ENERGY_EXCELLENT
+    ENERGY_GOOD = ENERGY_GOOD
+    ENERGY_FAIR = ENERGY_FAIR
 
     # Engagement-specific thresholds
-    ENGAGEMENT_EXCELLENT = 85
-    ENGAGEMENT_GOOD = 65
-    ENGAGEMENT_FAIR = 45
+    ENGAGEMENT_EXCELLENT = ENGAGEMENT_EXCELLENT
+    ENGAGEMENT_GOOD = ENGAGEMENT_GOOD
+    ENGAGEMENT_FAIR = ENGAGEMENT_FAIR
 
     # Exploration-specific thresholds
-    EXPLORATION_EXCELLENT = 70
-    EXPLORATION_GOOD = 50
-    EXPLORATION_FAIR = 30
+    EXPLORATION_EXCELLENT = EXPLORATION_EXCELLENT
+    EXPLORATION_GOOD = EXPLORATION_GOOD
+    EXPLORATION_FAIR = EXPLORATION_FAIR
 
 
 # ============================================================================
@@ -175,7 +226,7 @@ class TemporalConstants:
     WORKING_HOURS_RATIO_THRESHOLD = 0.8
     BURST_STD_MULTIPLIER = 2.0
     TREND_SLOPE_THRESHOLD = 1.0
-    WEEKEND_DAY_INDICES = {5, 6}  # Saturday, Sunday
+    WEEKEND_DAY_INDICES = frozenset({5, 6})  # Saturday, Sunday
 
 
 # ============================================================================
@@ -285,45 +336,65 @@ class RecommendationConstants:
 
 
 class RatingMaps:
-    """Lookup maps for ratings to avoid if/elif chains."""
+    """Lookup tables for ratings to avoid if/elif chains.
+
+    Tables are built once at import time; each row is ``(key, *bounds, label)`` and rows
+    are ordered by descending lower bound, so callers can return on the first match.
+    """
+
+    RATING_MAP = (
+        ("excellent", ScoringThresholds.EXCELLENT_THRESHOLD, "Excellent"),
+        ("good", ScoringThresholds.GOOD_THRESHOLD, "Good"),
+        ("fair", ScoringThresholds.FAIR_THRESHOLD, "Fair"),
+        (
+            "needs_improvement",
+            ScoringThresholds.NEEDS_IMPROVEMENT_THRESHOLD,
+            "Needs Improvement",
+        ),
+        ("poor", 0, "Poor"),
+    )
+
+    PERFORMANCE_RATING_MAP = (
+        ("excellent", 80, 100, "excellent"),
+        ("good", 60, 79, "good"),
+        ("fair", 40, 59, "fair"),
+        ("poor", 0, 39, "poor"),
+    )
+
+    BENCHMARK_RATING_MAP = (
+        ("excellent", BenchmarkingConstants.EXCELLENT_PERCENTILE, "excellent"),
+        ("good", BenchmarkingConstants.GOOD_PERCENTILE, "good"),
+        ("fair", BenchmarkingConstants.FAIR_PERCENTILE, "fair"),
+        ("poor", 0, "poor"),
+    )
 
     @staticmethod
-    def get_rating_map() -> Dict[str, tuple]:
+    def get_rating_map() -> Mapping[str, tuple]:
         """
         Get rating map for score-to-rating conversion.
 
-        Returns dict with (threshold, rating) tuples in descending order.
+        Returns a read-only mapping of (threshold, rating) tuples in descending order.
         """
-        return {
-            "excellent": (ScoringThresholds.EXCELLENT_THRESHOLD, "Excellent"),
-            "good": (ScoringThresholds.GOOD_THRESHOLD, "Good"),
-            "fair": (ScoringThresholds.FAIR_THRESHOLD, "Fair"),
-            "needs_improvement": (
-                ScoringThresholds.NEEDS_IMPROVEMENT_THRESHOLD,
-                "Needs Improvement",
-            ),
-            "poor": (0, "Poor"),
-        }
+        return _RATING_MAP_VIEW
 
     @staticmethod
-    def get_performance_rating_map() -> Dict[str, tuple]:
+    def get_performance_rating_map() -> Mapping[str, tuple]:
         """Get performance rating boundaries."""
-        return {
-            "excellent": (80, 100, "excellent"),
-            "good": (60, 79, "good"),
-            "fair": (40, 59, "fair"),
-            "poor": (0, 39, "poor"),
-        }
+        return _PERFORMANCE_RATING_MAP_VIEW
 
     @staticmethod
-    def get_benchmark_rating_map() -> Dict[str, tuple]:
+    def get_benchmark_rating_map() -> Mapping[str, tuple]:
         """Get benchmark rating boundaries (percentile-based)."""
-        return {
-            "excellent": (BenchmarkingConstants.EXCELLENT_PERCENTILE, "excellent"),
-            "good": (BenchmarkingConstants.GOOD_PERCENTILE, "good"),
-            "fair": (BenchmarkingConstants.FAIR_PERCENTILE, "fair"),
-            "poor": (0, "poor"),
-        }
+        return _BENCHMARK_RATING_MAP_VIEW
+
+
+def _as_view(rows: tuple) -> Mapping[str, tuple]:
+    return MappingProxyType({key: tuple(rest) for key, *rest in rows})
+
+
+_RATING_MAP_VIEW = _as_view(RatingMaps.RATING_MAP)
+_PERFORMANCE_RATING_MAP_VIEW = _as_view(RatingMaps.PERFORMANCE_RATING_MAP)
+_BENCHMARK_RATING_MAP_VIEW = _as_view(RatingMaps.BENCHMARK_RATING_MAP)
 
 
 # ============================================================================
@@ -334,15 +405,12 @@ class RatingMaps:
 class ValidationConstants:
     """Constants for data validation."""
 
-    VALID_COMMUNICATION_TYPES = {
-        "face-to-face",
-        "email",
-        "chat",
-        "meeting",
-        "video-call",
-        "phone",
-        "other",
-    }
+    # Ordered for error messages; validators test membership against the frozenset
+    COMMUNICATION_TYPES = tuple(
+        sys.intern(t)
+        for t in ("face-to-face", "email", "chat", "meeting", "video-call", "phone", "other")
+    )
+    VALID_COMMUNICATION_TYPES = frozenset(COMMUNICATION_TYPES)
 
     MAX_DURATION_HOURS = 8  # 480 minutes
     MAX_BULK_COMMUNICATIONS = 1000
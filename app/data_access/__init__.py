@@ -6,14 +6,18 @@ from .repositories import (
     TeamRepository,
     TeamMemberRepository,
     CommunicationRepository,
+    CommunicationRow,
     TeamMetricsRepository,
     ExternalTeamRepository,
+    Repositories,
 )
 
 __all__ = [
     "TeamRepository",
     "TeamMemberRepository",
     "CommunicationRepository",
+    "CommunicationRow",
     "TeamMetricsRepository",
     "ExternalTeamRepository",
+    "Repositories",
 ]
@@ -5,30 +5,62 @@ This layer provides repository pattern for database operations.
 Abstracts database queries and provides a clean interface for the business logic layer.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+import numpy as np
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import Result, Row, Select, bindparam, case, func, insert, select, text, union_all
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from functools import cached_property
+from typing import List, Optional, Dict, Tuple, TypedDict
 from ..database.models import Team, TeamMember, Communication, TeamMetrics, ExternalTeam
 
 
+class CommunicationRow(TypedDict, total=False):
+    """Column values for one ``CommunicationRepository.bulk_create`` row.
+
+    For trusted callers (HTTP input already validated, generated data): plain dicts
+    go straight to the INSERT without building a pydantic model or ORM object.
+    """
+
+    sender_id: int
+    team_id: int
+    communication_type: str
+    receiver_id: Optional[int]
+    duration_minutes: Optional[float]
+    is_group_communication: bool
+    is_cross_team: bool
+    message_content: Optional[str]
+    timestamp: datetime
+
+
 class TeamRepository:
     """Repository for Team operations"""
 
     def __init__(self, session: Session):
         self.session = session
 
-    def create(self, name: str, description: str = None) -> Team:
-        """Create a new team"""
+    def create(self, name: str, description: str = None, commit: bool = True) -> Team:
+        """Create a new team (``commit=False`` only flushes, leaving the commit to the caller)"""
         team = Team(name=name, description=description)
         self.session.add(team)
+        if not commit:
+            self.session.flush()
+            return team
         self.session.commit()
         self.session.refresh(team)
         return team
 
     def get_by_id(self, team_id: int) -> Optional[Team]:
         """Get team by ID"""
-        return self.session.query(Team).filter(Team.id == team_id).first()
+        return self.session.get(Team, team_id)
+
+    def get_by_id_with_members(self, team_id: int) -> Optional[Team]:
+        """Get team by ID with its members eagerly loaded"""
+        return (
+            self.session.query(Team)
+            .options(selectinload(Team.members))
+            .filter(Team.id == team_id)
+            .first()
+        )
 
     def get_by_name(self, name: str) -> Optional[Team]:
         """Get team by name"""
@@ -38,6 +70,15 @@ class TeamRepository:
         """Get all teams"""
         return self.session.query(Team).all()
 
+    def get_all_with_member_counts(self) -> List[Tuple[Team, int]]:
+        """Get all teams paired with their member count in a single grouped query"""
+        return (
+            self.session.query(Team, func.count(TeamMember.id))
+            .outerjoin(TeamMember, TeamMember.team_id == Team.id)
+            .group_by(Team.id)
+            .all()
+        )
+
     _UPDATE_ALLOWED = {"name", "description"}
 
     def update(self, team_id: int, **kwargs) -> Optional[Team]:
@@ -66,6 +107,8 @@ class TeamMemberRepository:
 
     def __init__(self, session: Session):
         self.session = session
+        # team_id -> sorted member id array; cleared on membership writes through this repository
+        self._member_ids_cache: Dict[int, np.ndarray] = {}
 
     def create(self, name: str, email: str, team_id: int, role: str = None) -> TeamMember:
         """Create a new team member"""
@@ -73,11 +116,33 @@ class TeamMemberRepository:
         self.session.add(member)
         self.session.commit()
         self.session.refresh(member)
+        self._member_ids_cache.clear()
         return member
 
+    def bulk_create(self, rows: List[Dict], commit: bool = True) -> List[int]:
+        """
+        Insert many team members in one executemany round trip.
+
+        Pass ``commit=False`` to leave the insert in the caller's open transaction.
+
+        Returns:
+            Primary keys of the inserted rows, in the same order as ``rows``
+        """
+        if not rows:
+            return []
+        result = self.session.execute(
+            insert(TeamMember).returning(TeamMember.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result.scalars())
+        if commit:
+            self.session.commit()
+        self._member_ids_cache.clear()
+        return ids
+
     def get_by_id(self, member_id: int) -> Optional[TeamMember]:
         """Get team member by ID"""
-        return self.session.query(TeamMember).filter(TeamMember.id == member_id).first()
+        return self.session.get(TeamMember, member_id)
 
     def get_by_email(self, email: str) -> Optional[TeamMember]:
         """Get team member by email"""
@@ -87,9 +152,28 @@ class TeamMemberRepository:
         """Get all members of a team"""
         return self.session.query(TeamMember).filter(TeamMember.team_id == team_id).all()
 
-    def get_all(self) -> List[TeamMember]:
-        """Get all team members"""
-        return self.session.query(TeamMember).all()
+    def get_member_ids_array(self, team_id: int) -> np.ndarray:
+        """Get a team's member ids as a sorted int64 array (cached per repository)"""
+        ids = self._member_ids_cache.get(team_id)
+        if ids is None:
+            stmt = (
+                select(TeamMember.id)
+                .where(TeamMember.team_id == team_id)
+                .order_by(TeamMember.id)
+            )
+            ids = np.fromiter(self.session.execute(stmt).scalars(), dtype=np.int64)
+            self._member_ids_cache[team_id] = ids
+        return ids
+
+    def get_all(self, limit: Optional[int] = None, after_id: int = 0) -> List[TeamMember]:
+        """
+        Get team members ordered by id (all of them by default).
+
+        With ``limit``, returns one page: pass the last id seen as ``after_id`` to get
+        the next one (keyset pagination on the primary key).
+        """
+        query = self.session.query(TeamMember).filter(TeamMember.id > after_id)
+        return query.order_by(TeamMember.id).limit(limit).all()
 
     def update(self, member_id: int, **kwargs) -> Optional[TeamMember]:
         """Update team member attributes"""
@@ -100,6 +184,7 @@ class TeamMemberRepository:
                     setattr(member, key, value)
             self.session.commit()
             self.session.refresh(member)
+            self._member_ids_cache.clear()
         return member
 
     def delete(self, member_id: int) -> bool:
@@ -108,10 +193,140 @@ class TeamMemberRepository:
         if member:
             self.session.delete(member)
             self.session.commit()
+            self._member_ids_cache.clear()
             return True
         return False
 
 
+# ── Pre-built communication queries ──────────────────────────────────────────
+# Statements are constructed once at import and executed with bound parameters, so a
+# call only pays for execution: no per-call Core construction, and SQLAlchemy reuses
+# the memoized cache key of the same statement object for its compiled-SQL cache.
+
+_WINDOW_BOUNDS = (
+    Communication.timestamp >= bindparam("start_date"),
+    Communication.timestamp <= bindparam("end_date"),
+)
+
+
+def _window_bounds(has_start: bool, has_end: bool) -> tuple:
+    flags = (has_start, has_end)
+    return tuple(bound for bound, on in zip(_WINDOW_BOUNDS, flags, strict=True) if on)
+
+
+def _windowed(stmt: Select) -> Dict[Tuple[bool, bool], Select]:
+    """Pre-build ``stmt`` for each combination of the optional start/end bounds."""
+    return {
+        (has_start, has_end): stmt.where(*_window_bounds(has_start, has_end))
+        for has_start in (False, True)
+        for has_end in (False, True)
+    }
+
+
+def _member_windowed(*columns) -> Dict[Tuple[bool, bool], Select]:
+    """
+    Pre-build "communications involving a member", newest first, per window variant.
+
+    A ``sender_id = ? OR receiver_id = ?`` filter can only use one index on most
+    planners; UNION ALL of two branches lets each seek its own (column, timestamp)
+    index. The receiver branch skips self-addressed rows so nothing is returned twice.
+    """
+    variants = {}
+    for has_start in (False, True):
+        for has_end in (False, True):
+            bounds = _window_bounds(has_start, has_end)
+            sent = select(*columns).where(
+                Communication.sender_id == bindparam("member_id"), *bounds
+            )
+            received = select(*columns).where(
+                Communication.receiver_id == bindparam("member_id"),
+                Communication.sender_id != bindparam("member_id"),
+                *bounds,
+            )
+            both = union_all(sent, received).subquery()
+            if columns[0] is Communication:
+                # Whole entity: map the union's columns back onto Communication
+                entity = aliased(Communication, both)
+                stmt = select(entity).order_by(entity.timestamp.desc())
+            else:
+                stmt = select(*both.c).order_by(both.c.timestamp.desc())
+            variants[(has_start, has_end)] = stmt
+    return variants
+
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+_BY_TEAM_ID = Communication.team_id == bindparam("team_id")
+_NEWEST_FIRST = Communication.timestamp.desc()
+
+# Columns serialized by the communications listing endpoint
+_LISTING_COLUMNS = (
+    Communication.id,
+    Communication.sender_id,
+    Communication.receiver_id,
+    Communication.team_id,
+    Communication.communication_type,
+    Communication.duration_minutes,
+    Communication.is_group_communication,
+    Communication.is_cross_team,
+    Communication.timestamp,
+)
+
+# Everything the Three E's scoring reads, in one scan of the team window
+_SCORING_COLUMNS = (
+    Communication.sender_id,
+    Communication.receiver_id,
+    Communication.communication_type,
+    Communication.duration_minutes,
+    Communication.is_cross_team,
+)
+
+# Undirected pair endpoints
+_PAIR_LOW = case(
+    (Communication.sender_id <= Communication.receiver_id, Communication.sender_id),
+    else_=Communication.receiver_id,
+).label("low_id")
+_PAIR_HIGH = case(
+    (Communication.sender_id <= Communication.receiver_id, Communication.receiver_id),
+    else_=Communication.sender_id,
+).label("high_id")
+
+_BY_TEAM = _windowed(select(Communication).where(_BY_TEAM_ID).order_by(_NEWEST_FIRST))
+_BY_MEMBER = _member_windowed(Communication)
+_ROWS_BY_TEAM = _windowed(select(*_LISTING_COLUMNS).where(_BY_TEAM_ID).order_by(_NEWEST_FIRST))
+_ROWS_BY_MEMBER = _member_windowed(*_LISTING_COLUMNS)
+# Scores are order-independent, so no ORDER BY
+_SCORING_BY_TEAM = _windowed(select(*_SCORING_COLUMNS).where(_BY_TEAM_ID))
+_DYADS = _windowed(
+    select(Communication.sender_id, Communication.receiver_id).where(
+        _BY_TEAM_ID, Communication.receiver_id.is_not(None)
+    )
+)
+_PAIR_COUNTS = _windowed(
+    select(_PAIR_LOW, _PAIR_HIGH, func.count().label("n"))
+    .where(_BY_TEAM_ID, Communication.receiver_id.is_not(None))
+    .group_by(_PAIR_LOW, _PAIR_HIGH)
+)
+_CROSS_TEAM = _windowed(
+    select(Communication).where(_BY_TEAM_ID, Communication.is_cross_team.is_(True))
+)
+_STATS = _windowed(
+    select(
+        func.count(),
+        _count_where(Communication.communication_type == "face-to-face"),
+        _count_where(Communication.is_group_communication.is_(True)),
+        _count_where(Communication.is_cross_team.is_(True)),
+        func.avg(Communication.duration_minutes),
+    ).where(_BY_TEAM_ID)
+)
+
+_PG_ESTIMATED_ROWS = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+).bindparams(table_name=Communication.__tablename__)
+
+
 class CommunicationRepository:
     """Repository for Communication operations"""
 
@@ -125,8 +340,8 @@ class CommunicationRepository:
         communication_type: str,
         receiver_id: int = None,
         duration_minutes: float = None,
-        is_group_communication: int = 0,
-        is_cross_team: int = 0,
+        is_group_communication: bool = False,
+        is_cross_team: bool = False,
         message_content: str = None,
         timestamp: datetime = None,
     ) -> Communication:
@@ -149,84 +364,150 @@ class CommunicationRepository:
         self.session.refresh(comm)
         return comm
 
+    def bulk_create(self, rows: List[CommunicationRow], commit: bool = True) -> List[int]:
+        """
+        Insert many communication records in one executemany round trip.
+
+        Bypasses the ORM unit of work, so model ``@validates`` hooks do not run;
+        the same timestamp/duration rules are applied once over the whole batch
+        via ``Communication.validate_batch`` (raises ``ValueError``).
+        Pass ``commit=False`` to leave the insert in the caller's open transaction.
+
+        Returns:
+            Primary keys of the inserted rows, in the same order as ``rows``
+        """
+        if not rows:
+            return []
+        Communication.validate_batch(rows)
+        result = self.session.execute(
+            insert(Communication).returning(Communication.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result.scalars())
+        if commit:
+            self.session.commit()
+        return ids
+
     def get_by_id(self, comm_id: int) -> Optional[Communication]:
         """Get communication by ID"""
-        return self.session.query(Communication).filter(Communication.id == comm_id).first()
+        return self.session.get(Communication, comm_id)
+
+    def _execute_windowed(
+        self, variants: Dict, start_date: datetime, end_date: datetime, **params
+    ) -> Result:
+        stmt = variants[(bool(start_date), bool(end_date))]
+        return self.session.execute(
+            stmt, {"start_date": start_date, "end_date": end_date, **params}
+        )
 
     def get_by_team(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> List[Communication]:
         """Get all communications for a team within a date range"""
-        query = self.session.query(Communication).filter(Communication.team_id == team_id)
+        return list(
+            self._execute_windowed(_BY_TEAM, start_date, end_date, team_id=team_id).scalars()
+        )
 
-        if start_date:
-            query = query.filter(Communication.timestamp >= start_date)
-        if end_date:
-            query = query.filter(Communication.timestamp <= end_date)
+    def get_rows_by_team(
+        self, team_id: int, start_date: datetime = None, end_date: datetime = None
+    ) -> List[Row]:
+        """
+        Get a team's communications as plain column rows (no ORM hydration).
+
+        Rows expose ``id``, ``sender_id``, ``receiver_id``, ``team_id``,
+        ``communication_type``, ``duration_minutes``, ``is_group_communication``,
+        ``is_cross_team`` and ``timestamp``, newest first.
+        """
+        return self._execute_windowed(
+            _ROWS_BY_TEAM, start_date, end_date, team_id=team_id
+        ).all()
+
+    def get_scoring_rows(
+        self, team_id: int, start_date: datetime = None, end_date: datetime = None
+    ) -> List[Row]:
+        """
+        Get the columns the Three E's scoring needs for a team, in one query.
+
+        Rows expose ``sender_id``, ``receiver_id``, ``communication_type``,
+        ``duration_minutes`` and ``is_cross_team``, in no particular order.
+        """
+        return self._execute_windowed(
+            _SCORING_BY_TEAM, start_date, end_date, team_id=team_id
+        ).all()
+
+    def get_dyads_by_team(
+        self, team_id: int, start_date: datetime = None, end_date: datetime = None
+    ) -> List[Row]:
+        """Get ``(sender_id, receiver_id)`` rows for a team's communications that have a receiver"""
+        return self._execute_windowed(_DYADS, start_date, end_date, team_id=team_id).all()
+
+    def get_pair_counts(
+        self, team_id: int, start_date: datetime = None, end_date: datetime = None
+    ) -> List[Row]:
+        """
+        Count a team's communications per undirected member pair in SQL.
 
-        return query.order_by(Communication.timestamp.desc()).all()
+        Returns ``(low_id, high_id, n)`` rows with ``low_id <= high_id``; communications
+        without a receiver are skipped. CASE keeps this portable (SQLite has no LEAST/GREATEST).
+        """
+        return self._execute_windowed(_PAIR_COUNTS, start_date, end_date, team_id=team_id).all()
+
+    def get_rows_by_member(
+        self, member_id: int, start_date: datetime = None, end_date: datetime = None
+    ) -> List[Row]:
+        """Get communications involving a member as plain column rows, newest first"""
+        return self._execute_windowed(
+            _ROWS_BY_MEMBER, start_date, end_date, member_id=member_id
+        ).all()
 
     def get_by_member(
         self, member_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> List[Communication]:
         """Get all communications involving a specific member"""
-        query = self.session.query(Communication).filter(
-            or_(Communication.sender_id == member_id, Communication.receiver_id == member_id)
+        return list(
+            self._execute_windowed(_BY_MEMBER, start_date, end_date, member_id=member_id).scalars()
         )
 
-        if start_date:
-            query = query.filter(Communication.timestamp >= start_date)
-        if end_date:
-            query = query.filter(Communication.timestamp <= end_date)
-
-        return query.order_by(Communication.timestamp.desc()).all()
-
     def get_cross_team_communications(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> List[Communication]:
         """Get cross-team (exploration) communications"""
-        query = self.session.query(Communication).filter(
-            and_(Communication.team_id == team_id, Communication.is_cross_team == 1)
+        return list(
+            self._execute_windowed(_CROSS_TEAM, start_date, end_date, team_id=team_id).scalars()
         )
 
-        if start_date:
-            query = query.filter(Communication.timestamp >= start_date)
-        if end_date:
-            query = query.filter(Communication.timestamp <= end_date)
-
-        return query.all()
-
     def get_communication_stats(
         self, team_id: int, start_date: datetime = None, end_date: datetime = None
     ) -> Dict:
         """Get communication statistics for a team"""
-        query = self.session.query(Communication).filter(Communication.team_id == team_id)
-
-        if start_date:
-            query = query.filter(Communication.timestamp >= start_date)
-        if end_date:
-            query = query.filter(Communication.timestamp <= end_date)
-
-        total = query.count()
-        face_to_face = query.filter(Communication.communication_type == "face-to-face").count()
-        group_comms = query.filter(Communication.is_group_communication == 1).count()
-        cross_team = query.filter(Communication.is_cross_team == 1).count()
-
-        avg_duration = (
-            self.session.query(func.avg(Communication.duration_minutes))
-            .filter(Communication.team_id == team_id)
-            .scalar()
-            or 0
-        )
+        # One pass over the window instead of a query per statistic
+        result = self._execute_windowed(_STATS, start_date, end_date, team_id=team_id)
+        total, face_to_face, group_comms, cross_team, avg_duration = result.one()
 
         return {
             "total_communications": total,
             "face_to_face": face_to_face,
             "group_communications": group_comms,
             "cross_team_communications": cross_team,
-            "avg_duration_minutes": float(avg_duration),
+            "avg_duration_minutes": float(avg_duration or 0),
         }
 
+    def estimated_row_count(self) -> Optional[int]:
+        """
+        Approximate size of the communications table, without scanning it.
+
+        PostgreSQL answers from planner statistics (``pg_class.reltuples``, refreshed by
+        ANALYZE/autovacuum). Returns None when no estimate exists: other backends keep
+        no such statistic, and PostgreSQL has none until the table is first analyzed.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return None
+        estimate = self.session.execute(_PG_ESTIMATED_ROWS).scalar()
+        # reltuples is -1 (PG 14+) or 0 until the table is first analyzed
+        if estimate is None or estimate <= 0:
+            return None
+        return int(estimate)
+
     def delete(self, comm_id: int) -> bool:
         """Delete a communication record"""
         comm = self.get_by_id(comm_id)
@@ -272,14 +553,14 @@ class TeamMetricsRepository:
 
     def get_by_id(self, metrics_id: int) -> Optional[TeamMetrics]:
         """Get metrics by ID"""
-        return self.session.query(TeamMetrics).filter(TeamMetrics.id == metrics_id).first()
+        return self.session.get(TeamMetrics, metrics_id)
 
     def get_latest_by_team(self, team_id: int) -> Optional[TeamMetrics]:
         """Get the most recent metrics for a team"""
         return (
             self.session.query(TeamMetrics)
             .filter(TeamMetrics.team_id == team_id)
-            .order_by(TeamMetrics.calculated_at.desc())
+            .order_by(TeamMetrics.calculated_at.desc(), TeamMetrics.id.desc())
             .first()
         )
 
@@ -288,32 +569,26 @@ class TeamMetricsRepository:
         return (
             self.session.query(TeamMetrics)
             .filter(TeamMetrics.team_id == team_id)
-            .order_by(TeamMetrics.calculated_at.desc())
+            .order_by(TeamMetrics.calculated_at.desc(), TeamMetrics.id.desc())
             .limit(limit)
             .all()
         )
 
     def get_all_latest(self) -> List[TeamMetrics]:
         """Get latest metrics for all teams"""
-        subquery = (
-            self.session.query(
-                TeamMetrics.team_id, func.max(TeamMetrics.calculated_at).label("max_date")
+        # One pass ranking each team's rows newest-first (served by idx_team_calculated)
+        rn = (
+            func.row_number()
+            .over(
+                partition_by=TeamMetrics.team_id,
+                order_by=(TeamMetrics.calculated_at.desc(), TeamMetrics.id.desc()),
             )
-            .group_by(TeamMetrics.team_id)
-            .subquery()
-        )
-
-        return (
-            self.session.query(TeamMetrics)
-            .join(
-                subquery,
-                and_(
-                    TeamMetrics.team_id == subquery.c.team_id,
-                    TeamMetrics.calculated_at == subquery.c.max_date,
-                ),
-            )
-            .all()
+            .label("rn")
         )
+        ranked = select(TeamMetrics, rn).subquery()
+        latest = aliased(TeamMetrics, ranked)
+        stmt = select(latest).where(ranked.c.rn == 1).options(selectinload(latest.team))
+        return list(self.session.execute(stmt).scalars())
 
 
 class ExternalTeamRepository:
@@ -332,8 +607,35 @@ class ExternalTeamRepository:
 
     def get_by_id(self, team_id: int) -> Optional[ExternalTeam]:
         """Get external team by ID"""
-        return self.session.query(ExternalTeam).filter(ExternalTeam.id == team_id).first()
+        return self.session.get(ExternalTeam, team_id)
 
     def get_all(self) -> List[ExternalTeam]:
         """Get all external teams"""
         return self.session.query(ExternalTeam).all()
+
+
+class Repositories:
+    """Per-session bundle of repositories, each constructed on first use"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @cached_property
+    def teams(self) -> TeamRepository:
+        return TeamRepository(self.session)
+
+    @cached_property
+    def members(self) -> TeamMemberRepository:
+        return TeamMemberRepository(self.session)
+
+    @cached_property
+    def communications(self) -> CommunicationRepository:
+        return CommunicationRepository(self.session)
+
+    @cached_property
+    def metrics(self) -> TeamMetricsRepository:
+        return TeamMetricsRepository(self.session)
+
+    @cached_property
+    def external_teams(self) -> ExternalTeamRepository:
+        return ExternalTeamRepository(self.session)
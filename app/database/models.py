@@ -9,16 +9,20 @@ from sqlalchemy import (
     create_engine,
     Column,
     Integer,
+    Boolean,
     String,
     Float,
     DateTime,
     ForeignKey,
     Text,
     Index,
+    func,
 )
 from sqlalchemy.orm import declarative_base, relationship, validates
 from datetime import datetime, timezone
 
+import numpy as np
+
 Base = declarative_base()
 
 
@@ -30,7 +34,7 @@ class Team(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
@@ -53,7 +57,7 @@ class TeamMember(Base):
     email = Column(String(100), unique=True)
     role = Column(String(50))
     team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
-    joined_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     team = relationship("Team", back_populates="members")
@@ -77,6 +81,7 @@ class Communication(Base):
     __table_args__ = (
         Index("idx_team_timestamp", "team_id", "timestamp"),
         Index("idx_sender_timestamp", "sender_id", "timestamp"),
+        Index("idx_receiver_timestamp", "receiver_id", "timestamp"),
         Index("idx_cross_team", "team_id", "is_cross_team", "timestamp"),
         Index("idx_communication_type", "communication_type"),
     )
@@ -89,11 +94,11 @@ class Communication(Base):
     # Communication details
     communication_type = Column(String(50))  # face-to-face, email, chat, meeting, etc.
     duration_minutes = Column(Float)  # Duration of interaction
-    is_group_communication = Column(Integer, default=0)  # 0=one-on-one, 1=group
-    is_cross_team = Column(Integer, default=0)  # 0=internal, 1=external/exploration
+    is_group_communication = Column(Boolean, default=False)  # False=one-on-one, True=group
+    is_cross_team = Column(Boolean, default=False)  # False=internal, True=external/exploration
 
     message_content = Column(Text)  # Optional: for analyzing content
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
     # NEW: Track external team if cross-team communication
     external_team_id = Column(Integer, ForeignKey("external_teams.id"))
@@ -128,6 +133,30 @@ class Communication(Base):
                 raise ValueError("Duration cannot exceed 8 hours (480 minutes)")
         return duration
 
+    @classmethod
+    def validate_batch(cls, rows: list[dict]) -> None:
+        """
+        Apply the timestamp and duration checks to many rows at once.
+
+        Core bulk inserts bypass ``@validates``; this runs the same rules with a single
+        clock read and one vectorized pass over durations. Raises ``ValueError``.
+        """
+        if not rows:
+            return
+        now = datetime.now(timezone.utc)
+        now_naive = now.replace(tzinfo=None)
+        for row in rows:
+            timestamp = row.get("timestamp")
+            if timestamp and timestamp > (now if timestamp.tzinfo else now_naive):
+                raise ValueError("Cannot create communications with future timestamps")
+
+        # None becomes NaN, which fails both comparisons
+        durations = np.array([row.get("duration_minutes") for row in rows], dtype=float)
+        if (durations < 0).any():
+            raise ValueError("Duration cannot be negative")
+        if (durations > 480).any():
+            raise ValueError("Duration cannot exceed 8 hours (480 minutes)")
+
     def __repr__(self):
         return f"<Communication(id={self.id}, type='{self.communication_type}', timestamp={self.timestamp})>"
 
@@ -154,7 +183,7 @@ class TeamMetrics(Base):
     # Metadata
     calculation_period_start = Column(DateTime)
     calculation_period_end = Column(DateTime)
-    calculated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    calculated_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Additional metrics
     total_communications = Column(Integer)
@@ -180,14 +209,23 @@ class ExternalTeam(Base):
     name = Column(String(100), nullable=False)
     department = Column(String(100))
     description = Column(Text)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f"<ExternalTeam(id={self.id}, name='{self.name}')>"
 
 
-def init_db(database_url):
-    """Initialize the database with the given URL"""
-    engine = create_engine(database_url, echo=False)
+def init_db(database_url, **pool_options):
+    """
+    Initialize the database with the given URL
+
+    Extra keyword arguments (``pool_size``, ``max_overflow``, ``pool_timeout``,
+    ``pool_recycle``) configure the connection pool for server databases.
+    SQLite keeps SQLAlchemy's default pool classes, which do not accept them.
+    """
+    engine_options = {}
+    if not database_url.startswith("sqlite"):
+        engine_options = {"pool_pre_ping": True, **pool_options}
+    engine = create_engine(database_url, echo=False, **engine_options)
     Base.metadata.create_all(engine)
     return engine
@@ -1,10 +1,14 @@
 """Date and time utilities."""
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Tuple
 
 from .config import ValidationConstants
 
+# Dashboards poll with the same date filters; datetimes are immutable so sharing is safe
+_parse_iso = lru_cache(maxsize=1024)(datetime.fromisoformat)
+
 
 def parse_date_range(
     days: int = ValidationConstants.DEFAULT_ANALYSIS_DAYS,
@@ -22,7 +26,7 @@ def parse_date_range(
     Returns:
         Tuple of (start_date, end_date) as datetime objects
     """
-    end = datetime.fromisoformat(end_date) if end_date else datetime.now(timezone.utc)
-    start = datetime.fromisoformat(start_date) if start_date else end - timedelta(days=days)
+    end = _parse_iso(end_date) if end_date else datetime.now(timezone.utc)
+    start = _parse_iso(start_date) if start_date else end - timedelta(days=days)
 
     return start, end
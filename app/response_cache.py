@@ -0,0 +1,85 @@
+"""
+Short-TTL cache for serialized API responses.
+
+Dashboards poll the metrics endpoints far more often than ``/calculate`` runs,
+so their JSON bodies are cached for a few seconds. Redis is used when a URL is
+configured and the ``redis`` package is installed (shared across workers);
+otherwise entries live in a per-process dict, which is only safe with a single
+worker, so ``Config`` leaves the cache off unless ``REDIS_URL`` is set.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Cache of response bodies keyed by string, with a fixed TTL in seconds"""
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 60, prefix: str = "orgnet:"):
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = None
+        self._local: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+        if ttl > 0 and redis_url and redis is not None:
+            self._redis = redis.Redis.from_url(redis_url, socket_connect_timeout=1)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body, or None on miss/expiry/backend error"""
+        if not self.enabled:
+            return None
+        if self._redis is not None:
+            try:
+                return self._redis.get(self.prefix + key)
+            except redis.RedisError as e:
+                logger.warning(f"Response cache read failed for {key}: {e}")
+                return None
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            return body
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a body for ``ttl`` seconds"""
+        if not self.enabled:
+            return
+        if self._redis is not None:
+            try:
+                self._redis.setex(self.prefix + key, self.ttl, body)
+            except redis.RedisError as e:
+                logger.warning(f"Response cache write failed for {key}: {e}")
+            return
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, body)
+
+    def delete(self, *keys: str) -> None:
+        """Invalidate keys (e.g. after metrics are recalculated)"""
+        if not self.enabled or not keys:
+            return
+        if self._redis is not None:
+            try:
+                self._redis.delete(*(self.prefix + k for k in keys))
+            except redis.RedisError as e:
+                logger.warning(f"Response cache invalidation failed for {keys}: {e}")
+            return
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
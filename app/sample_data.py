@@ -5,12 +5,18 @@ Generates sample data for testing and demonstration purposes
 """
 
 from datetime import datetime, timedelta, timezone
-import random
-from typing import Dict
+from typing import Dict, List
+
+import numpy as np
 from sqlalchemy.orm import Session
 
-from .database.models import Team, TeamMember, Communication
-from .data_access.repositories import TeamRepository, TeamMemberRepository, CommunicationRepository
+from .database.models import Team
+from .data_access.repositories import (
+    CommunicationRepository,
+    CommunicationRow,
+    TeamMemberRepository,
+    TeamRepository,
+)
 
 
 class SampleDataGenerator:
@@ -23,7 +29,7 @@ class SampleDataGenerator:
         self.comm_repo = CommunicationRepository(session)
 
     def generate_sample_team(
-        self, name: str = "Engineering Team Alpha", num_members: int = 8
+        self, name: str = "Engineering Team Alpha", num_members: int = 8, commit: bool = True
     ) -> Team:
         """
         Generate a sample team with members
@@ -31,6 +37,7 @@ class SampleDataGenerator:
         Args:
             name: Team name
             num_members: Number of team members to create
+            commit: Commit when done; False leaves the rows in the open transaction
 
         Returns:
             Created Team object
@@ -39,6 +46,7 @@ class SampleDataGenerator:
         team = self.team_repo.create(
             name=name,
             description="A high-performance engineering team focused on product development",
+            commit=False,
         )
 
         # Sample member names and roles
@@ -55,18 +63,26 @@ class SampleDataGenerator:
             ("Jack Anderson", "DevOps Engineer"),
         ]
 
-        # Create members
-        created_members = []
-        for i in range(min(num_members, len(sample_members))):
-            name, role = sample_members[i]
-            email = f"{name.lower().replace(' ', '.')}@company.com"
-            member = self.member_repo.create(name=name, email=email, team_id=team.id, role=role)
-            created_members.append(member)
+        # Create members in one batch
+        self.member_repo.bulk_create(
+            [
+                {
+                    "name": name,
+                    "email": f"{name.lower().replace(' ', '.')}@company.com",
+                    "team_id": team.id,
+                    "role": role,
+                }
+                for name, role in sample_members[:num_members]
+            ],
+            commit=False,
+        )
+        if commit:
+            self.session.commit()
 
         return team
 
     def generate_sample_communications(
-        self, team_id: int, days: int = 30, intensity: str = "high"
+        self, team_id: int, days: int = 30, intensity: str = "high", commit: bool = True
     ) -> int:
         """
         Generate sample communications for a team
@@ -75,6 +91,7 @@ class SampleDataGenerator:
             team_id: ID of the team
             days: Number of days to generate data for
             intensity: 'low', 'medium', or 'high' communication intensity
+            commit: Commit when done; False leaves the rows in the open transaction
 
         Returns:
             Number of communications created
@@ -83,85 +100,96 @@ class SampleDataGenerator:
         if not members:
             return 0
 
-        member_ids = [m.id for m in members]
+        member_ids = np.array([m.id for m in members])
+        num_members = len(member_ids)
 
         # Set communication frequency based on intensity
         intensity_map = {"low": 2, "medium": 5, "high": 10}
         comms_per_day = intensity_map.get(intensity, 5)
 
-        # Communication types and their weights (face-to-face preferred per research)
+        # Communication types, weights (face-to-face preferred per research),
+        # and inclusive duration range in minutes
         comm_types = [
-            ("face-to-face", 0.4),
-            ("meeting", 0.25),
-            ("chat", 0.15),
-            ("email", 0.10),
-            ("video-call", 0.10),
+            ("face-to-face", 0.4, 5, 30),
+            ("meeting", 0.25, 15, 60),
+            ("chat", 0.15, 5, 30),
+            ("email", 0.10, 2, 10),
+            ("video-call", 0.10, 15, 60),
         ]
+        type_names = [ct[0] for ct in comm_types]
+        type_weights = np.array([ct[1] for ct in comm_types])
+        duration_low = np.array([ct[2] for ct in comm_types])
+        duration_high = np.array([ct[3] for ct in comm_types])
 
-        count = 0
         end_date = datetime.now(timezone.utc)
 
-        for day in range(days):
-            current_date = end_date - timedelta(days=day)
-
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                continue
-
-            # Generate communications for this day
-            num_comms = random.randint(comms_per_day - 2, comms_per_day + 3)
-
-            for _ in range(num_comms):
-                # Select sender
-                sender_id = random.choice(member_ids)
-
-                # Decide if group communication or one-on-one
-                is_group = random.random() < 0.3  # 30% chance of group comm
-
-                if is_group:
-                    receiver_id = None
-                else:
-                    # Select receiver (different from sender)
-                    possible_receivers = [m for m in member_ids if m != sender_id]
-                    receiver_id = random.choice(possible_receivers) if possible_receivers else None
-
-                # Select communication type (weighted)
-                comm_type = random.choices(
-                    [ct[0] for ct in comm_types], weights=[ct[1] for ct in comm_types]
-                )[0]
-
-                # Duration (in minutes)
-                if comm_type in ["face-to-face", "chat"]:
-                    duration = random.randint(5, 30)
-                elif comm_type in ["meeting", "video-call"]:
-                    duration = random.randint(15, 60)
-                else:
-                    duration = random.randint(2, 10)
-
-                # Cross-team communication (10% chance)
-                is_cross_team = random.random() < 0.1
-
-                # Random time during work hours
-                hour = random.randint(9, 17)
-                minute = random.randint(0, 59)
-                timestamp = current_date.replace(hour=hour, minute=minute, second=0)
-
-                # Create communication
-                comm = Communication(
-                    sender_id=sender_id,
-                    receiver_id=receiver_id,
-                    team_id=team_id,
-                    communication_type=comm_type,
-                    duration_minutes=duration,
-                    is_group_communication=1 if is_group else 0,
-                    is_cross_team=1 if is_cross_team else 0,
-                    timestamp=timestamp,
-                )
-                self.session.add(comm)
-                count += 1
-
-        self.session.commit()
-        return count
+        # Weekdays only
+        day_dates = [
+            d for d in (end_date - timedelta(days=day) for day in range(days)) if d.weekday() < 5
+        ]
+        if not day_dates:
+            return 0
+
+        # Draw every random variate up front, one array per attribute
+        rng = np.random.default_rng()
+        per_day = rng.integers(
+            comms_per_day - 2, comms_per_day + 4, size=len(day_dates)
+        )
+        n = int(per_day.sum())
+        day_index = np.repeat(np.arange(len(day_dates)), per_day)
+
+        sender_index = rng.integers(0, num_members, size=n)
+        # 30% chance of group comm (no receiver)
+        is_group = rng.random(n) < 0.3
+        # Receiver: uniform over the other members, by shifting the sender index
+        receiver_index = (sender_index + rng.integers(1, max(num_members, 2), size=n)) % num_members
+        has_receiver = ~is_group & (num_members > 1)
+
+        type_index = rng.choice(len(comm_types), size=n, p=type_weights / type_weights.sum())
+        durations = rng.integers(duration_low[type_index], duration_high[type_index] + 1)
+
+        # Cross-team communication (10% chance)
+        is_cross_team = rng.random(n) < 0.1
+
+        # Random minute during work hours (09:00-17:59), as UTC datetime64 offsets from
+        # each day's midnight; clamped because later today would be a future timestamp
+        day_starts = np.array(
+            [d.replace(tzinfo=None).date() for d in day_dates], dtype="datetime64[us]"
+        )
+        minute_of_day = rng.integers(9 * 60, 18 * 60, size=n).astype("timedelta64[m]")
+        timestamps = np.minimum(
+            day_starts[day_index] + minute_of_day,
+            np.datetime64(end_date.replace(tzinfo=None), "us"),
+        )
+
+        # Generated values are valid by construction: no pydantic validation per row
+        rows: List[CommunicationRow] = []
+        for timestamp, sender, receiver, with_receiver, group, t, duration, cross in zip(
+            timestamps.tolist(),
+            member_ids[sender_index].tolist(),
+            member_ids[receiver_index].tolist(),
+            has_receiver.tolist(),
+            is_group.tolist(),
+            type_index.tolist(),
+            durations.tolist(),
+            is_cross_team.tolist(),
+            strict=True,
+        ):
+            rows.append(
+                {
+                    "sender_id": sender,
+                    "receiver_id": receiver if with_receiver else None,
+                    "team_id": team_id,
+                    "communication_type": type_names[t],
+                    "duration_minutes": duration,
+                    "is_group_communication": group,
+                    "is_cross_team": cross,
+                    "timestamp": timestamp.replace(tzinfo=timezone.utc),
+                }
+            )
+
+        # One executemany instead of a unit-of-work flush per row
+        return len(self.comm_repo.bulk_create(rows, commit=commit))
 
     def generate_complete_sample(
         self,
@@ -169,15 +197,19 @@ class SampleDataGenerator:
         num_members: int = 8,
         days: int = 30,
         intensity: str = "high",
+        commit: bool = True,
     ) -> Dict:
         """
         Generate a complete sample dataset with team, members, and communications
 
+        Everything is written in one transaction, committed at the end unless
+        ``commit`` is False.
+
         Returns:
             Dictionary with created objects info
         """
-        team = self.generate_sample_team(team_name, num_members)
-        num_comms = self.generate_sample_communications(team.id, days, intensity)
+        team = self.generate_sample_team(team_name, num_members, commit=False)
+        num_comms = self.generate_sample_communications(team.id, days, intensity, commit=commit)
 
         return {
             "team_id": team.id,
@@ -205,11 +237,18 @@ def generate_sample_data(session: Session, num_teams: int = 3):
         ("Struggling Team", 5, 30, "low"),
     ]
 
+    # All teams go into one transaction: a single commit (and fsync) for the whole run
     results = []
-    for i in range(min(num_teams, len(teams_config))):
-        config = teams_config[i]
-        result = generator.generate_complete_sample(*config)
-        results.append(result)
+    try:
+        for i in range(min(num_teams, len(teams_config))):
+            config = teams_config[i]
+            results.append(generator.generate_complete_sample(*config, commit=False))
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    for result in results:
         print(
             f"Created: {result['team_name']} with {result['num_members']} members and {result['num_communications']} communications"
         )
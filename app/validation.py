@@ -4,9 +4,38 @@ Input Validation Schemas
 Pydantic schemas for validating API inputs
 """
 
-from pydantic import BaseModel, field_validator, EmailStr, Field
+from pydantic import (
+    BaseModel,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
 from typing import Optional, Annotated
 from datetime import datetime, timezone
+from functools import cache
+
+from .config import ValidationConstants
+
+_VALID_CONTEXTS = (
+    "standup",
+    "1:1",
+    "planning",
+    "review",
+    "brainstorm",
+    "feedback",
+    "social",
+    "training",
+    "other",
+)
+_VALID_CONTEXT_SET = frozenset(_VALID_CONTEXTS)
+_VALID_COMMUNICATION_TYPES = ValidationConstants.VALID_COMMUNICATION_TYPES
+
+_INVALID_TYPE_MSG = "Invalid communication type. Must be one of: " + ", ".join(
+    ValidationConstants.COMMUNICATION_TYPES
+)
+_INVALID_CONTEXT_MSG = f'Invalid context. Must be one of: {", ".join(_VALID_CONTEXTS)}'
 
 
 class TeamCreate(BaseModel):
@@ -70,11 +99,8 @@ class CommunicationCreate(BaseModel):
     @field_validator("communication_type")
     @classmethod
     def validate_type(cls, v):
-        valid_types = ["face-to-face", "email", "chat", "meeting", "video-call", "phone", "other"]
-        if v not in valid_types:
-            raise ValueError(
-                f'Invalid communication type. Must be one of: {", ".join(valid_types)}'
-            )
+        if v not in _VALID_COMMUNICATION_TYPES:
+            raise ValueError(_INVALID_TYPE_MSG)
         return v
 
     @field_validator("receiver_id")
@@ -94,20 +120,8 @@ class CommunicationCreate(BaseModel):
     @field_validator("context")
     @classmethod
     def validate_context(cls, v):
-        if v:
-            valid_contexts = [
-                "standup",
-                "1:1",
-                "planning",
-                "review",
-                "brainstorm",
-                "feedback",
-                "social",
-                "training",
-                "other",
-            ]
-            if v not in valid_contexts:
-                raise ValueError(f'Invalid context. Must be one of: {", ".join(valid_contexts)}')
+        if v and v not in _VALID_CONTEXT_SET:
+            raise ValueError(_INVALID_CONTEXT_MSG)
         return v
 
 
@@ -173,10 +187,48 @@ def validate_request(schema_class, data: dict):
         If invalid: (None, errors) - errors are JSON-serializable
     """
     try:
-        validated = schema_class(**data)
+        # model_validate goes straight to the compiled pydantic-core validator
+        # (no kwargs unpacking) and reports non-dict payloads as validation errors
+        validated = schema_class.model_validate(data)
         return validated, None
+    except ValidationError as e:
+        return None, _sanitize_for_json(e.errors())
     except Exception as e:
-        if hasattr(e, "errors"):
-            raw_errors = e.errors()
-            return None, _sanitize_for_json(raw_errors)
         return None, [{"msg": str(e)}]
+
+
+@cache
+def _list_adapter(schema_class) -> TypeAdapter:
+    """Compiled validator for ``list[schema_class]``, built once per schema"""
+    return TypeAdapter(list[schema_class])
+
+
+def validate_many(schema_class, items: list):
+    """
+    Validate a list of payloads against a schema in one pass
+
+    Returns:
+        Tuple of (validated_list, errors)
+        errors is a list of {"index": i, "errors": [...]} for each invalid item;
+        validated_list only contains the items that passed.
+    """
+    try:
+        # Whole batch in a single pydantic-core call
+        return _list_adapter(schema_class).validate_python(items), []
+    except ValidationError as e:
+        by_index = {}
+        for error in e.errors():
+            if not error["loc"]:
+                # items itself isn't a list
+                return [], [{"index": None, "errors": _sanitize_for_json(e.errors())}]
+            idx, *loc = error["loc"]
+            by_index.setdefault(idx, []).append({**error, "loc": tuple(loc)})
+
+    validated_list = [
+        schema_class.model_validate(item) for idx, item in enumerate(items) if idx not in by_index
+    ]
+    errors = [
+        {"index": idx, "errors": _sanitize_for_json(item_errors)}
+        for idx, item_errors in sorted(by_index.items())
+    ]
+    return validated_list, errors
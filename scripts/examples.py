@@ -3,11 +3,21 @@ Example Usage Script
 Demonstrates how to use the Three E's application
 """
 
+import asyncio
 import logging
-import requests
+import os
+import shelve
+import time
+import httpx
 from datetime import datetime
 import json
 
+# ijson is optional: with it, uncached metric listings are parsed as they stream in
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,22 +29,84 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "http://localhost:5000"
 
+# Read-through disk cache for idempotent GETs; set EXAMPLES_CACHE_TTL=0 to disable
+CACHE_PATH = os.getenv("EXAMPLES_CACHE_PATH", ".examples_cache")
+CACHE_TTL = int(os.getenv("EXAMPLES_CACHE_TTL", "300"))
+
+
+async def cached_get(client, path, max_age=None):
+    """GET a JSON resource, reusing a stored copy younger than max_age (default CACHE_TTL) seconds.
+
+    Older copies are revalidated with If-None-Match; a 304 reuses them without a body.
+    """
+    if CACHE_TTL <= 0:
+        return (await client.get(path)).json()
+
+    key = f"{client.base_url}{path}"
+    with shelve.open(CACHE_PATH) as cache:
+        entry = cache.get(key)
+
+    headers = {}
+    if entry is not None:
+        stored_at, etag, data = entry
+        if time.time() - stored_at < (CACHE_TTL if max_age is None else max_age):
+            logger.debug("Cache hit: %s", path)
+            return data
+        if etag:
+            headers["If-None-Match"] = etag
+
+    response = await client.get(path, headers=headers)
+    if response.status_code == 304:
+        logger.debug("Not modified: %s", path)
+    else:
+        data = response.json()
+        # Empty results aren't worth keeping (an empty team list would hide new teams)
+        if response.status_code != 200 or not data:
+            return data
+    with shelve.open(CACHE_PATH) as cache:
+        cache[key] = (time.time(), response.headers.get("ETag"), data)
+    return data
+
+
+class _AsyncByteReader:
+    """Async file-like view of an httpx response body, as ijson expects"""
 
-def example_create_team():
+    def __init__(self, response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, n=-1):
+        if n == 0:  # ijson probes read(0) for bytes vs str; don't consume a chunk
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def stream_json_items(client, path):
+    """Yield the items of a top-level JSON array as they are parsed off the wire"""
+    async with client.stream("GET", path) as response:
+        async for item in ijson.items(_AsyncByteReader(response), "item", use_float=True):
+            yield item
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def example_create_team(client):
     """Example: Create a new team"""
     logger.info("Creating a new team...")
 
-    response = requests.post(
-        f"{BASE_URL}/api/v1/teams",
+    response = await client.post(
+        "/api/v1/teams",
         json={"name": "Innovation Lab", "description": "Cross-functional innovation team"},
     )
 
     team = response.json()
-    logger.info(f"Created team: {team['name']} (ID: {team['id']})")
+    logger.info("Created team: %s (ID: %s)", team["name"], team["id"])
     return team["id"]
 
 
-def example_add_members(team_id):
+async def example_add_members(client, team_id):
     """Example: Add team members"""
     logger.info("Adding team members...")
 
@@ -45,169 +117,201 @@ def example_add_members(team_id):
         {"name": "David Kim", "email": "david.kim@company.com", "role": "Product Manager"},
     ]
 
-    member_ids = []
     for member_data in members:
         member_data["team_id"] = team_id
-        response = requests.post(f"{BASE_URL}/api/v1/members", json=member_data)
+
+    # Independent POSTs: send them concurrently; gather() keeps responses in input order
+    responses = await asyncio.gather(
+        *(client.post("/api/v1/members", json=p) for p in members)
+    )
+
+    member_ids = []
+    for response in responses:
         member = response.json()
         member_ids.append(member["id"])
-        logger.info(f"Added member: {member['name']} ({member['role']})")
+        logger.info("Added member: %s (%s)", member["name"], member["role"])
 
     return member_ids
 
 
-def example_record_communications(team_id, member_ids):
+async def example_record_communications(client, team_id, member_ids):
     """Example: Record various types of communications"""
     logger.info("Recording communications...")
 
-    # Face-to-face meeting
-    requests.post(
-        f"{BASE_URL}/api/v1/communications",
-        json={
-            "sender_id": member_ids[0],
-            "receiver_id": member_ids[1],
-            "team_id": team_id,
-            "communication_type": "face-to-face",
-            "duration_minutes": 20,
-            "is_group": False,
-            "is_cross_team": False,
-        },
-    )
-    logger.info("Recorded face-to-face meeting (20 min)")
-
-    # Team meeting
-    requests.post(
-        f"{BASE_URL}/api/v1/communications",
-        json={
-            "sender_id": member_ids[0],
-            "team_id": team_id,
-            "communication_type": "meeting",
-            "duration_minutes": 60,
-            "is_group": True,
-            "is_cross_team": False,
-        },
-    )
-    logger.info("Recorded group meeting (60 min)")
-
-    # Cross-team collaboration
-    requests.post(
-        f"{BASE_URL}/api/v1/communications",
-        json={
-            "sender_id": member_ids[2],
-            "team_id": team_id,
-            "communication_type": "face-to-face",
-            "duration_minutes": 30,
-            "is_group": False,
-            "is_cross_team": True,
-        },
+    communications = [
+        (
+            "Recorded face-to-face meeting (20 min)",
+            {
+                "sender_id": member_ids[0],
+                "receiver_id": member_ids[1],
+                "team_id": team_id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 20,
+                "is_group": False,
+                "is_cross_team": False,
+            },
+        ),
+        (
+            "Recorded group meeting (60 min)",
+            {
+                "sender_id": member_ids[0],
+                "team_id": team_id,
+                "communication_type": "meeting",
+                "duration_minutes": 60,
+                "is_group": True,
+                "is_cross_team": False,
+            },
+        ),
+        (
+            "Recorded cross-team collaboration (30 min)",
+            {
+                "sender_id": member_ids[2],
+                "team_id": team_id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 30,
+                "is_group": False,
+                "is_cross_team": True,
+            },
+        ),
+    ]
+
+    # One bulk POST instead of a round-trip per record
+    response = await client.post(
+        "/api/v1/communications/bulk",
+        json={"communications": [payload for _, payload in communications]},
     )
-    logger.info("Recorded cross-team collaboration (30 min)")
+    if response.status_code != 201:
+        logger.error("Bulk create failed: %s", response.json())
+        return
+
+    for message, _ in communications:
+        logger.info(message)
 
 
-def example_calculate_metrics(team_id):
+async def example_calculate_metrics(client, team_id):
     """Example: Calculate Three E's metrics"""
     logger.info("Calculating Three E's metrics...")
 
-    response = requests.post(f"{BASE_URL}/api/v1/calculate/{team_id}", json={"days": 30})
+    response = await client.post(f"/api/v1/calculate/{team_id}", json={"days": 30})
     metrics = response.json()
 
-    logger.info(f"Results for Team ID {team_id}:")
-    logger.info(f"  Energy Score: {metrics['energy']['energy_score']:.2f}/100")
-    logger.info(f"  Engagement Score: {metrics['engagement']['engagement_score']:.2f}/100")
-    logger.info(f"  Exploration Score: {metrics['exploration']['exploration_score']:.2f}/100")
-    logger.info(f"  Overall Score: {metrics['overall_score']:.2f}/100")
-
-    logger.debug(f"Energy - Total Communications: {metrics['energy']['total_communications']}")
-    logger.debug(f"Energy - Face-to-Face Ratio: {metrics['energy']['face_to_face_ratio']:.2%}")
-    logger.debug(f"Engagement - Participation Rate: {metrics['engagement']['participation_rate']:.2%}")
-    logger.debug(f"Engagement - Balance Score: {metrics['engagement']['balance_score']:.2f}")
-    logger.debug(f"Exploration - Cross-team Communications: {metrics['exploration']['cross_team_communications']}")
-    logger.debug(f"Exploration - Members Exploring: {metrics['exploration']['members_exploring']}")
+    energy = metrics["energy"]
+    engagement = metrics["engagement"]
+    exploration = metrics["exploration"]
+
+    logger.info("Results for Team ID %s:", team_id)
+    logger.info("  Energy Score: %.2f/100", energy["energy_score"])
+    logger.info("  Engagement Score: %.2f/100", engagement["engagement_score"])
+    logger.info("  Exploration Score: %.2f/100", exploration["exploration_score"])
+    logger.info("  Overall Score: %.2f/100", metrics["overall_score"])
+
+    # %-style args: the message is only formatted if DEBUG is enabled
+    logger.debug("Energy - Total Communications: %s", energy["total_communications"])
+    logger.debug("Energy - Face-to-Face Ratio: %.2f%%", energy["face_to_face_ratio"] * 100)
+    logger.debug("Engagement - Participation Rate: %.2f%%", engagement["participation_rate"] * 100)
+    logger.debug("Engagement - Balance Score: %.2f", engagement["balance_score"])
+    logger.debug(
+        "Exploration - Cross-team Communications: %s", exploration["cross_team_communications"]
+    )
+    logger.debug("Exploration - Members Exploring: %s", exploration["members_exploring"])
 
 
-def example_get_all_teams_metrics():
+async def example_get_all_teams_metrics(client):
     """Example: Get metrics for all teams"""
     logger.info("Retrieving metrics for all teams...")
 
-    response = requests.get(f"{BASE_URL}/api/v1/metrics/all")
-    all_metrics = response.json()
-
-    if not all_metrics:
-        logger.warning("No metrics available. Calculate metrics first.")
-        return
-
-    logger.info("Team Performance Comparison:")
-    for metric in all_metrics:
+    path = "/api/v1/metrics/all"
+    if ijson is not None and CACHE_TTL <= 0:
+        # Log each team as it arrives instead of materializing the whole list
+        all_metrics = stream_json_items(client, path)
+    else:
+        # Always revalidated (max_age=0): it is read right after a recalculation
+        all_metrics = _aiter(await cached_get(client, path, max_age=0))
+
+    count = 0
+    async for metric in all_metrics:
+        if not count:
+            logger.info("Team Performance Comparison:")
+        count += 1
         team_name = metric.get("team_name", "Unknown")
         logger.info(
-            f"  {team_name}: Overall={metric['overall_score']:.1f}, "
-            f"Energy={metric['energy_score']:.1f}, "
-            f"Engagement={metric['engagement_score']:.1f}, "
-            f"Exploration={metric['exploration_score']:.1f}"
+            "  %s: Overall=%.1f, Energy=%.1f, Engagement=%.1f, Exploration=%.1f",
+            team_name,
+            metric["overall_score"],
+            metric["energy_score"],
+            metric["engagement_score"],
+            metric["exploration_score"],
         )
 
+    if not count:
+        logger.warning("No metrics available. Calculate metrics first.")
+
 
-def example_network_analysis(team_id):
+async def example_network_analysis(client, team_id):
     """Example: Analyze team communication network"""
     logger.info("Analyzing communication network...")
 
-    response = requests.get(f"{BASE_URL}/api/v1/network/{team_id}")
-    network = response.json()
+    network = await cached_get(client, f"/api/v1/network/{team_id}")
 
-    logger.info(f"Network metrics for Team {team_id}:")
-    logger.info(f"  Density: {network.get('density', 0):.3f}")
-    logger.info(f"  Nodes: {network.get('num_nodes', 0)}, Edges: {network.get('num_edges', 0)}")
-    logger.info(f"  Connected: {network.get('is_connected', False)}")
+    logger.info("Network metrics for Team %s:", team_id)
+    logger.info("  Density: %.3f", network.get("density", 0))
+    logger.info("  Nodes: %s, Edges: %s", network.get("num_nodes", 0), network.get("num_edges", 0))
+    logger.info("  Connected: %s", network.get("is_connected", False))
 
     if "most_central_member_id" in network:
-        logger.info(f"  Most Central Member: {network['most_central_member_id']}")
+        logger.info("  Most Central Member: %s", network["most_central_member_id"])
 
     if "potential_bottlenecks" in network and network["potential_bottlenecks"]:
-        logger.warning(f"  Potential Bottlenecks: {network['potential_bottlenecks']}")
+        logger.warning("  Potential Bottlenecks: %s", network["potential_bottlenecks"])
 
 
-def run_examples():
+async def run_examples():
     """Run all examples"""
     logger.info("Three E's Application - Usage Examples")
     logger.info("Make sure the API server is running (python app.py)")
 
-    try:
-        # Check if server is running
-        response = requests.get(BASE_URL)
-        if response.status_code != 200:
+    # One client for every call: pooled keep-alive connections, closed on exit
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        try:
+            # Check if server is running
+            response = await client.get("/")
+            if response.status_code != 200:
+                logger.error("Cannot connect to API server")
+                logger.error("Start the server with: python app.py")
+                return
+
+            # Use existing team (ID 1) if available, or create new one
+            logger.info("Checking for existing teams...")
+            existing_teams = await cached_get(client, "/api/v1/teams")
+
+            if existing_teams:
+                team_id = existing_teams[0]["id"]
+                logger.info("Using existing team: %s (ID: %s)", existing_teams[0]["name"], team_id)
+
+                # Calculate metrics for existing team; the network read doesn't depend on it
+                await asyncio.gather(
+                    example_calculate_metrics(client, team_id),
+                    example_network_analysis(client, team_id),
+                )
+                await example_get_all_teams_metrics(client)
+            else:
+                logger.info("No existing teams found. Creating new team...")
+                team_id = await example_create_team(client)
+                member_ids = await example_add_members(client, team_id)
+                await example_record_communications(client, team_id, member_ids)
+                await asyncio.gather(
+                    example_calculate_metrics(client, team_id),
+                    example_network_analysis(client, team_id),
+                )
+
+            logger.info("Examples completed successfully!")
+
+        except httpx.ConnectError:
             logger.error("Cannot connect to API server")
             logger.error("Start the server with: python app.py")
-            return
-
-        # Use existing team (ID 1) if available, or create new one
-        logger.info("Checking for existing teams...")
-        teams_response = requests.get(f"{BASE_URL}/api/v1/teams")
-        existing_teams = teams_response.json()
-
-        if existing_teams:
-            team_id = existing_teams[0]["id"]
-            logger.info(f"Using existing team: {existing_teams[0]['name']} (ID: {team_id})")
-
-            # Calculate metrics for existing team
-            example_calculate_metrics(team_id)
-            example_network_analysis(team_id)
-            example_get_all_teams_metrics()
-        else:
-            logger.info("No existing teams found. Creating new team...")
-            team_id = example_create_team()
-            member_ids = example_add_members(team_id)
-            example_record_communications(team_id, member_ids)
-            example_calculate_metrics(team_id)
-            example_network_analysis(team_id)
-
-        logger.info("Examples completed successfully!")
-
-    except requests.exceptions.ConnectionError:
-        logger.error("Cannot connect to API server")
-        logger.error("Start the server with: python app.py")
-    except Exception as e:
-        logger.error(f"Error running examples: {str(e)}", exc_info=True)
+        except Exception as e:
+            logger.error("Error running examples: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
-    run_examples()
+    asyncio.run(run_examples())
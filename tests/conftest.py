@@ -13,27 +13,94 @@ if _netsmith_src.exists() and str(_netsmith_src) not in sys.path:
 
 import pytest
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.database.models import Base, Team, TeamMember, Communication
 from app.data_access.repositories import TeamRepository, TeamMemberRepository, CommunicationRepository
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """Create a test database engine"""
-    engine = create_engine("sqlite:///:memory:")
+    """Create the test database engine (one in-memory DB, schema built once per run)"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def session(engine):
-    """Create a test database session"""
-    Session = sessionmaker(bind=engine)
+    """Create a test database session, rolled back after the test.
+
+    Repository commits only release a SAVEPOINT inside the outer transaction, so
+    every test starts from the empty schema without re-running DDL.
+    """
+    connection = engine.connect()
+    trans = connection.begin()
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = Session()
     yield session
     session.close()
+    trans.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_engine():
+    """In-memory DB shared by every test app on this worker (schema built once per run)
+
+    StaticPool keeps a single connection, so request and background-job threads
+    all see the same database.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def app_db_template(app_engine):
+    """Snapshot of ``app_engine``'s freshly created DB (schema, no rows)"""
+    raw = app_engine.raw_connection()
+    try:
+        return raw.driver_connection.serialize()
+    finally:
+        raw.close()
+
+
+@pytest.fixture
+def clean_app_db(app, app_engine, app_db_template):
+    """Reset the shared app DB after each test.
+
+    Deserializes the empty-schema snapshot over the live SQLite connection, which
+    is cheaper than re-running ``init_db`` DDL or deleting rows table by table.
+    """
+    yield
+    app.session_factory.remove()
+    raw = app_engine.raw_connection()
+    try:
+        raw.driver_connection.deserialize(app_db_template)
+    finally:
+        raw.close()
 
 
 @pytest.fixture
@@ -2,23 +2,41 @@
 Tests for Flask API endpoints.
 """
 
+import time
+
 import pytest
-import json
-from app import create_app
+from app.app import create_app
 from app.config import Config
 
+# Request bodies go through client.post(json=...), i.e. the app's JSON provider
+# (orjson when installed); responses are parsed with the same library
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
 
 class TestConfig(Config):
     """Config with in-memory DB for isolated tests."""
     DATABASE_URL = "sqlite:///:memory:"
     TESTING = True
     SECRET_KEY = "test-secret-key"
+    # The app outlives each test (module-scoped), so cached bodies must not either
+    RESPONSE_CACHE_TTL = 0
 
 
-@pytest.fixture
-def app():
-    """Create Flask app for testing with isolated in-memory DB"""
-    return create_app(config_class=TestConfig)
+# Every test gets the app's DB back in its just-created state (see conftest)
+pytestmark = pytest.mark.usefixtures("clean_app_db")
+
+
+@pytest.fixture(scope="module")
+def app(app_engine):
+    """Create the Flask app once per module; ``clean_app_db`` isolates tests"""
+    return create_app(config_class=TestConfig, engine=app_engine)
 
 
 @pytest.fixture
@@ -35,7 +53,7 @@ class TestHealthEndpoints:
         response = client.get("/health")
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["status"] == "healthy"
         assert data["database"] == "connected"
 
@@ -45,15 +63,37 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert response.content_type == "text/plain; charset=utf-8"
 
+    def test_metrics_endpoint_omits_estimate_without_planner_statistics(self, client):
+        """Test /metrics skips the communications gauge on SQLite rather than counting"""
+        body = client.get("/metrics").data.decode()
+        assert "orgnet_teams_total 0" in body
+        assert "orgnet_communications_estimated" not in body
+
     def test_root_endpoint(self, client):
         """Test API info endpoint"""
         response = client.get("/")
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["name"] == "Three Es Organizational Network API"
         assert "endpoints" in data
 
+    def test_legacy_prefix_not_in_url_map(self, app, client):
+        """Test legacy /api/* URLs are rewritten rather than registered as rules"""
+        rules = [rule.rule for rule in app.url_map.iter_rules()]
+        assert not [r for r in rules if r.startswith("/api/") and not r.startswith("/api/v1/")]
+
+        response = client.get("/api/teams")
+        assert response.status_code == 200
+
+    def test_apps_get_separate_memory_databases(self):
+        """Test two apps on sqlite:///:memory: don't see each other's rows"""
+        first = create_app(config_class=TestConfig).test_client()
+        second = create_app(config_class=TestConfig).test_client()
+
+        assert first.post("/api/teams", json={"name": "Only Here"}).status_code == 201
+        assert _loads(second.get("/api/teams").data) == []
+
 
 class TestTeamEndpoints:
     """Tests for team CRUD endpoints"""
@@ -62,12 +102,11 @@ class TestTeamEndpoints:
         """Test creating a new team"""
         response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Test Team", "description": "A test team"}),
-            content_type="application/json"
+            json={"name": "Test Team", "description": "A test team"}
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["name"] == "Test Team"
         assert "id" in data
 
@@ -75,8 +114,7 @@ class TestTeamEndpoints:
         """Test validation when creating team without name"""
         response = client.post(
             "/api/teams",
-            data=json.dumps({"description": "No name"}),
-            content_type="application/json"
+            json={"description": "No name"}
         )
         
         assert response.status_code == 422  # Validation error
@@ -86,32 +124,56 @@ class TestTeamEndpoints:
         # Create a team first
         client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team 1", "description": "First team"}),
-            content_type="application/json"
+            json={"name": "Team 1", "description": "First team"}
         )
         
         response = client.get("/api/teams")
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert isinstance(data, list)
         assert len(data) >= 1
 
+    def test_list_teams_member_count(self, client):
+        """Test member_count reflects team membership, including empty teams"""
+        team_id = _loads(client.post(
+            "/api/teams",
+            json={"name": "Counted Team", "description": "Test"}
+        ).data)["id"]
+        client.post(
+            "/api/teams",
+            json={"name": "Empty Team", "description": "Test"}
+        )
+        for i in range(2):
+            client.post(
+                "/api/members",
+                json={
+                    "name": f"Counted {i}",
+                    "email": f"counted{i}@test.com",
+                    "team_id": team_id,
+                    "role": "Engineer"
+                }
+            )
+
+        data = _loads(client.get("/api/teams").data)
+        counts = {t["name"]: t["member_count"] for t in data}
+        assert counts["Counted Team"] == 2
+        assert counts["Empty Team"] == 0
+
     def test_get_team_by_id(self, client):
         """Test getting specific team"""
         # Create team
         create_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team X", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Team X", "description": "Test"}
         )
-        team_id = json.loads(create_response.data)["id"]
+        team_id = _loads(create_response.data)["id"]
         
         # Get team
         response = client.get(f"/api/teams/{team_id}")
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["name"] == "Team X"
 
     def test_get_nonexistent_team(self, client):
@@ -123,19 +185,17 @@ class TestTeamEndpoints:
         """Test updating a team with valid data"""
         create_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Update Test Original", "description": "Original desc"}),
-            content_type="application/json",
+            json={"name": "Update Test Original", "description": "Original desc"},
         )
         assert create_response.status_code == 201
-        team_id = json.loads(create_response.data)["id"]
+        team_id = _loads(create_response.data)["id"]
 
         response = client.put(
             f"/api/teams/{team_id}",
-            data=json.dumps({"name": "Update Test Updated", "description": "Updated desc"}),
-            content_type="application/json",
+            json={"name": "Update Test Updated", "description": "Updated desc"},
         )
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["name"] == "Update Test Updated"
         assert data["description"] == "Updated desc"
         assert data["id"] == team_id
@@ -144,19 +204,17 @@ class TestTeamEndpoints:
         """Test that update_team ignores malicious id field (allowlist)"""
         create_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "ID Overwrite Target", "description": "Target"}),
-            content_type="application/json",
+            json={"name": "ID Overwrite Target", "description": "Target"},
         )
         assert create_response.status_code == 201
-        team_id = json.loads(create_response.data)["id"]
+        team_id = _loads(create_response.data)["id"]
 
         response = client.put(
             f"/api/teams/{team_id}",
-            data=json.dumps({"name": "ID Overwrite Hacked", "id": 99999}),
-            content_type="application/json",
+            json={"name": "ID Overwrite Hacked", "id": 99999},
         )
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["id"] == team_id
         assert data["name"] == "ID Overwrite Hacked"
 
@@ -164,16 +222,14 @@ class TestTeamEndpoints:
         """Test update rejects empty name"""
         create_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Empty Name Validation Team", "description": "Test"}),
-            content_type="application/json",
+            json={"name": "Empty Name Validation Team", "description": "Test"},
         )
         assert create_response.status_code == 201
-        team_id = json.loads(create_response.data)["id"]
+        team_id = _loads(create_response.data)["id"]
 
         response = client.put(
             f"/api/teams/{team_id}",
-            data=json.dumps({"name": ""}),
-            content_type="application/json",
+            json={"name": ""},
         )
         assert response.status_code == 422
 
@@ -182,10 +238,9 @@ class TestTeamEndpoints:
         # Create team
         create_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Delete Me", "description": "Temp"}),
-            content_type="application/json"
+            json={"name": "Delete Me", "description": "Temp"}
         )
-        team_id = json.loads(create_response.data)["id"]
+        team_id = _loads(create_response.data)["id"]
         
         # Delete team
         response = client.delete(f"/api/teams/{team_id}")
@@ -204,25 +259,23 @@ class TestMemberEndpoints:
         # Create team first
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Team", "description": "Test"}
         )
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
         
         # Add member
         response = client.post(
             "/api/members",
-            data=json.dumps({
+            json={
                 "name": "John Doe",
                 "email": "john@test.com",
                 "team_id": team_id,
                 "role": "Engineer"
-            }),
-            content_type="application/json"
+            }
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["name"] == "John Doe"
 
     def test_list_team_members(self, client):
@@ -230,29 +283,69 @@ class TestMemberEndpoints:
         # Create team and member
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Team", "description": "Test"}
         )
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
         
         client.post(
             "/api/members",
-            data=json.dumps({
+            json={
                 "name": "Member 1",
                 "email": "m1@test.com",
                 "team_id": team_id,
                 "role": "Engineer"
-            }),
-            content_type="application/json"
+            }
         )
         
         # List members
         response = client.get(f"/api/members?team_id={team_id}")
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data) == 1
 
+    def test_list_all_members_paginated(self, client):
+        """Test unfiltered member listing pages by id with limit/after_id"""
+        team_response = client.post(
+            "/api/teams",
+            json={"name": "Team", "description": "Test"}
+        )
+        team_id = _loads(team_response.data)["id"]
+
+        for i in range(3):
+            client.post(
+                "/api/members",
+                json={"name": f"Member {i}", "email": f"m{i}@test.com", "team_id": team_id}
+            )
+
+        first_response = client.get("/api/members?limit=2")
+        first = _loads(first_response.data)
+        assert len(first) == 2
+        next_url = f"/api/v1/members?limit=2&after_id={first[-1]['id']}"
+        assert first_response.headers["Link"] == f'<{next_url}>; rel="next"'
+
+        rest_response = client.get(next_url)
+        assert [m["name"] for m in _loads(rest_response.data)] == ["Member 2"]
+        assert "Link" not in rest_response.headers
+
+    def test_list_all_members_unpaged_by_default(self, client):
+        """Test unfiltered member listing returns every member without paging params"""
+        team_response = client.post(
+            "/api/teams",
+            json={"name": "Team", "description": "Test"}
+        )
+        team_id = _loads(team_response.data)["id"]
+
+        for i in range(101):
+            client.post(
+                "/api/members",
+                json={"name": f"Member {i}", "email": f"m{i}@test.com", "team_id": team_id}
+            )
+
+        response = client.get("/api/members")
+        assert len(_loads(response.data)) == 101
+        assert "Link" not in response.headers
+
 
 class TestCommunicationEndpoints:
     """Tests for communication recording endpoints"""
@@ -262,39 +355,36 @@ class TestCommunicationEndpoints:
         # Setup: Create team and members
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Team", "description": "Test"}
         )
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
         
         member1_response = client.post(
             "/api/members",
-            data=json.dumps({
+            json={
                 "name": "Alice",
                 "email": "alice@test.com",
                 "team_id": team_id,
                 "role": "Engineer"
-            }),
-            content_type="application/json"
+            }
         )
-        member1_id = json.loads(member1_response.data)["id"]
+        member1_id = _loads(member1_response.data)["id"]
         
         member2_response = client.post(
             "/api/members",
-            data=json.dumps({
+            json={
                 "name": "Bob",
                 "email": "bob@test.com",
                 "team_id": team_id,
                 "role": "Engineer"
-            }),
-            content_type="application/json"
+            }
         )
-        member2_id = json.loads(member2_response.data)["id"]
+        member2_id = _loads(member2_response.data)["id"]
         
         # Record communication
         response = client.post(
             "/api/communications",
-            data=json.dumps({
+            json={
                 "sender_id": member1_id,
                 "receiver_id": member2_id,
                 "team_id": team_id,
@@ -302,12 +392,11 @@ class TestCommunicationEndpoints:
                 "duration_minutes": 30,
                 "is_group": False,
                 "is_cross_team": False
-            }),
-            content_type="application/json"
+            }
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data["type"] == "face-to-face"
 
     def test_bulk_create_communications(self, client):
@@ -315,39 +404,76 @@ class TestCommunicationEndpoints:
         # Setup
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Team", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Team", "description": "Test"}
         )
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
         
-        m1 = json.loads(client.post(
+        m1 = _loads(client.post(
             "/api/members",
-            data=json.dumps({"name": "M1", "email": "m1@test.com", "team_id": team_id, "role": "Eng"}),
-            content_type="application/json"
+            json={"name": "M1", "email": "m1@test.com", "team_id": team_id, "role": "Eng"}
         ).data)["id"]
         
-        m2 = json.loads(client.post(
+        m2 = _loads(client.post(
             "/api/members",
-            data=json.dumps({"name": "M2", "email": "m2@test.com", "team_id": team_id, "role": "Eng"}),
-            content_type="application/json"
+            json={"name": "M2", "email": "m2@test.com", "team_id": team_id, "role": "Eng"}
         ).data)["id"]
         
         # Bulk create
         response = client.post(
             "/api/communications/bulk",
-            data=json.dumps({
+            json={
                 "communications": [
                     {"sender_id": m1, "receiver_id": m2, "team_id": team_id, "communication_type": "chat"},
                     {"sender_id": m2, "receiver_id": m1, "team_id": team_id, "communication_type": "email"}
                 ]
-            }),
-            content_type="application/json"
+            }
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert len(data["ids"]) == 2
 
+        # Listing returns the created rows with serialized flags
+        list_response = client.get(f"/api/communications?team_id={team_id}")
+        assert list_response.status_code == 200
+        listed = _loads(list_response.data)
+        assert sorted(c["id"] for c in listed) == sorted(data["ids"])
+        assert all(c["is_group"] is False for c in listed)
+
+    def test_create_communication_reports_field_errors(self, client):
+        """Test every invalid field is reported, each under its own loc"""
+        response = client.post(
+            "/api/communications",
+            json={"sender_id": 0, "team_id": 1, "communication_type": "fax"}
+        )
+        assert response.status_code == 422
+        details = _loads(response.data)["details"]
+        assert [tuple(e["loc"]) for e in details] == [("sender_id",), ("communication_type",)]
+
+        response = client.post(
+            "/api/communications",
+            json={
+                "sender_id": 1,
+                "receiver_id": 1,
+                "team_id": 1,
+                "communication_type": "email",
+                "context": "offsite"
+            }
+        )
+        assert response.status_code == 422
+        details = _loads(response.data)["details"]
+        assert [tuple(e["loc"]) for e in details] == [("receiver_id",), ("context",)]
+
+    def test_list_communications_rejects_invalid_days(self, client):
+        """Test listing communications validates the days window (1-365)"""
+        response = client.get("/api/communications?team_id=1&days=0")
+        assert response.status_code == 422
+
+    def test_list_communications_requires_filter(self, client):
+        """Test listing communications without team_id or member_id is rejected"""
+        response = client.get("/api/communications")
+        assert response.status_code == 400
+
 
 class TestMetricsEndpoints:
     """Tests for metrics calculation endpoints"""
@@ -357,20 +483,18 @@ class TestMetricsEndpoints:
         # Setup team with communications
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Metrics Team", "description": "Test"}),
-            content_type="application/json"
+            json={"name": "Metrics Team", "description": "Test"}
         )
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
         
         # Calculate metrics
         response = client.post(
             f"/api/calculate/{team_id}",
-            data=json.dumps({"days": 30}),
-            content_type="application/json"
+            json={"days": 30}
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert "energy" in data
         assert "engagement" in data
         assert "exploration" in data
@@ -380,15 +504,88 @@ class TestMetricsEndpoints:
         """Test calculate rejects days out of range (1-365)"""
         team_response = client.post(
             "/api/teams",
-            data=json.dumps({"name": "Invalid Days Metrics Team", "description": "Test"}),
-            content_type="application/json",
+            json={"name": "Invalid Days Metrics Team", "description": "Test"},
         )
         assert team_response.status_code == 201
-        team_id = json.loads(team_response.data)["id"]
+        team_id = _loads(team_response.data)["id"]
 
         response = client.post(
             f"/api/calculate/{team_id}",
-            data=json.dumps({"days": 999999}),
-            content_type="application/json",
+            json={"days": 999999},
+        )
+        assert response.status_code == 422
+
+    def test_calculate_metrics_reports_date_field_errors(self, client):
+        """Test date range errors are reported under the offending field"""
+        response = client.post(
+            "/api/calculate/1",
+            json={"days": 0, "start_date": "2999-01-01T00:00:00Z"},
         )
         assert response.status_code == 422
+        details = _loads(response.data)["details"]
+        assert [tuple(e["loc"]) for e in details] == [("days",), ("start_date",)]
+
+        response = client.post(
+            "/api/calculate/1",
+            json={"start_date": "2024-02-01T00:00:00Z", "end_date": "2024-01-01T00:00:00Z"},
+        )
+        assert response.status_code == 422
+        details = _loads(response.data)["details"]
+        assert [tuple(e["loc"]) for e in details] == [("end_date",)]
+
+    def test_all_metrics_conditional_get(self, client):
+        """Test /metrics/all sends an ETag and answers If-None-Match with 304"""
+        response = client.get("/api/v1/metrics/all")
+        assert response.status_code == 200
+        etag = response.headers.get("ETag")
+        assert etag
+
+        revalidated = client.get("/api/v1/metrics/all", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b""
+
+    def test_calculate_metrics_async(self, app, client):
+        """Test ?async=true answers 202 and the job's status can be polled"""
+        team_id = _loads(client.post(
+            "/api/teams",
+            json={"name": "Async Metrics Team", "description": "Test"}
+        ).data)["id"]
+
+        response = client.post(f"/api/calculate/{team_id}?async=true", json={"days": 30})
+        assert response.status_code == 202
+        data = _loads(response.data)
+        assert data["status"] == "queued"
+        assert data["metrics_url"] == f"/api/v1/metrics/{team_id}"
+        # No Redis in tests: job status isn't shared across workers, so no status_url
+        assert "status_url" not in data
+
+        job = _wait_for_job(client, data["job_id"])
+        assert job["status"] == "succeeded"
+        assert job["result"]["team_id"] == team_id
+        assert client.get(data["metrics_url"]).status_code == 200
+
+    def test_calculation_status_hides_failure_details(self, app, client):
+        """Test a failed job reports a generic error instead of the exception text"""
+        def boom():
+            raise RuntimeError("connection to db-internal:5432 refused")
+
+        job = _wait_for_job(client, app.job_runner.submit(boom))
+        assert job["status"] == "failed"
+        assert job["error"] == "Calculation failed"
+
+    def test_calculation_status_unknown_job(self, client):
+        """Test polling an unknown job id returns 404"""
+        response = client.get("/api/v1/calculate/status/does-not-exist")
+        assert response.status_code == 404
+
+
+def _wait_for_job(client, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get(f"/api/v1/calculate/status/{job_id}")
+        assert response.status_code == 200
+        job = _loads(response.data)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        assert time.monotonic() < deadline, "job did not finish in time"
+        time.sleep(0.01)
@@ -0,0 +1,95 @@
+"""
+Tests for the in-process background job runner.
+"""
+
+import time
+
+from app.background import JOB_FAILED, JOB_SUCCEEDED, JobRunner
+
+
+class TestJobRunner:
+    """Tests for JobRunner status tracking"""
+
+    def test_successful_job_records_result(self):
+        runner = JobRunner(max_workers=1)
+        job_id = runner.submit(lambda a, b: a + b, 2, 3)
+        runner.shutdown(wait=True)
+
+        job = runner.status(job_id)
+        assert job["status"] == JOB_SUCCEEDED
+        assert job["result"] == 5
+
+    def test_failed_job_records_error(self):
+        runner = JobRunner(max_workers=1)
+
+        def boom():
+            raise ValueError("no data")
+
+        job_id = runner.submit(boom)
+        runner.shutdown(wait=True)
+
+        job = runner.status(job_id)
+        assert job["status"] == JOB_FAILED
+        assert job["error"] == "no data"
+
+    def test_unknown_job_returns_none(self):
+        runner = JobRunner(max_workers=1)
+        assert runner.status("missing") is None
+        runner.shutdown()
+
+    def test_finished_jobs_are_evicted_past_cap(self):
+        runner = JobRunner(max_workers=1, max_retained=2)
+        job_ids = []
+        for i in range(3):
+            job_ids.append(runner.submit(lambda value=i: value))
+            _wait_until_finished(runner, job_ids[-1])
+        runner.shutdown()
+
+        assert runner.status(job_ids[0]) is None
+        assert runner.status(job_ids[1])["result"] == 1
+        assert runner.status(job_ids[2])["result"] == 2
+
+    def test_in_process_runner_is_not_shared(self):
+        runner = JobRunner(max_workers=1)
+        assert runner.shared is False
+        runner.shutdown()
+
+
+class _FakeRedis:
+    """Just enough of redis.Redis for JobRunner (get/setex)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value.encode()
+
+
+class TestSharedJobRunner:
+    """Tests for JobRunner with job records in Redis"""
+
+    def test_status_is_visible_to_other_workers(self):
+        store = _FakeRedis()
+        runner = JobRunner(max_workers=1)
+        runner._redis = store
+        job_id = runner.submit(lambda: {"overall_score": 70.5})
+        runner.shutdown(wait=True)
+
+        # A second process with the same Redis sees the finished job
+        other = JobRunner(max_workers=1)
+        other._redis = store
+        assert other.shared is True
+        job = other.status(job_id)
+        assert job["status"] == JOB_SUCCEEDED
+        assert job["result"] == {"overall_score": 70.5}
+        other.shutdown()
+
+
+def _wait_until_finished(runner, job_id, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while runner.status(job_id)["status"] not in (JOB_SUCCEEDED, JOB_FAILED):
+        assert time.monotonic() < deadline, "job did not finish in time"
+        time.sleep(0.01)
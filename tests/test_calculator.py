@@ -27,15 +27,17 @@ class TestEnergyCalculation:
         calculator = ThreeEsCalculator(session)
         
         # Add face-to-face communications with timestamp in range
-        for i in range(20):
-            comm_repo.create(
-                sender_id=members[0].id,
-                receiver_id=members[1].id,
-                team_id=team.id,
-                communication_type="face-to-face",
-                duration_minutes=30,
-                timestamp=mid_date,
-            )
+        comm_repo.bulk_create([
+            {
+                "sender_id": members[0].id,
+                "receiver_id": members[1].id,
+                "team_id": team.id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 30,
+                "timestamp": mid_date,
+            }
+            for _ in range(20)
+        ])
         
         result = calculator.calculate_energy(team.id, thirty_days_ago, now)
         
@@ -49,15 +51,17 @@ class TestEnergyCalculation:
         calculator = ThreeEsCalculator(session)
         
         # Add 20 face-to-face for team 1
-        for i in range(20):
-            comm_repo.create(
-                sender_id=members[0].id,
-                receiver_id=members[1].id,
-                team_id=team.id,
-                communication_type="face-to-face",
-                duration_minutes=30,
-                timestamp=mid_date,
-            )
+        comm_repo.bulk_create([
+            {
+                "sender_id": members[0].id,
+                "receiver_id": members[1].id,
+                "team_id": team.id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 30,
+                "timestamp": mid_date,
+            }
+            for _ in range(20)
+        ])
         
         f2f_result = calculator.calculate_energy(team.id, thirty_days_ago, now)
         
@@ -67,15 +71,17 @@ class TestEnergyCalculation:
         email_team = team_repo.create("Email Team", "Email only team")
         
         # Add same number of email communications
-        for i in range(20):
-            comm_repo.create(
-                sender_id=members[0].id,
-                receiver_id=members[1].id,
-                team_id=email_team.id,
-                communication_type="email",
-                duration_minutes=30,
-                timestamp=mid_date,
-            )
+        comm_repo.bulk_create([
+            {
+                "sender_id": members[0].id,
+                "receiver_id": members[1].id,
+                "team_id": email_team.id,
+                "communication_type": "email",
+                "duration_minutes": 30,
+                "timestamp": mid_date,
+            }
+            for _ in range(20)
+        ])
         
         email_result = calculator.calculate_energy(email_team.id, thirty_days_ago, now)
         
@@ -87,16 +93,18 @@ class TestEnergyCalculation:
         team, members = sample_team
         calculator = ThreeEsCalculator(session)
         
-        # Add excessive communications
-        for i in range(1000):
-            comm_repo.create(
-                sender_id=members[i % len(members)].id,
-                receiver_id=members[(i + 1) % len(members)].id,
-                team_id=team.id,
-                communication_type="face-to-face",
-                duration_minutes=60,
-                timestamp=mid_date,
-            )
+        # Add excessive communications (one batched INSERT)
+        comm_repo.bulk_create([
+            {
+                "sender_id": members[i % len(members)].id,
+                "receiver_id": members[(i + 1) % len(members)].id,
+                "team_id": team.id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 60,
+                "timestamp": mid_date,
+            }
+            for i in range(1000)
+        ])
         
         result = calculator.calculate_energy(team.id, thirty_days_ago, now)
         
@@ -121,20 +129,21 @@ class TestEngagementCalculation:
         team, members = sample_team
         calculator = ThreeEsCalculator(session)
         
-        # Create fully connected, balanced communications
-        for sender in members:
-            for receiver in members:
-                if sender.id != receiver.id:
-                    # Each pair communicates exactly twice
-                    for _ in range(2):
-                        comm_repo.create(
-                            sender_id=sender.id,
-                            receiver_id=receiver.id,
-                            team_id=team.id,
-                            communication_type="face-to-face",
-                            duration_minutes=15,
-                            timestamp=mid_date,
-                        )
+        # Create fully connected, balanced communications: each pair exactly twice
+        comm_repo.bulk_create([
+            {
+                "sender_id": sender.id,
+                "receiver_id": receiver.id,
+                "team_id": team.id,
+                "communication_type": "face-to-face",
+                "duration_minutes": 15,
+                "timestamp": mid_date,
+            }
+            for sender in members
+            for receiver in members
+            if sender.id != receiver.id
+            for _ in range(2)
+        ])
         
         result = calculator.calculate_engagement(team.id, thirty_days_ago, now)
         
@@ -147,25 +156,29 @@ class TestEngagementCalculation:
         team, members = sample_team
         calculator = ThreeEsCalculator(session)
         
-        # Member 0 sends 95% of communications
-        for i in range(95):
-            comm_repo.create(
-                sender_id=members[0].id,
-                receiver_id=members[i % 4 + 1].id,
-                team_id=team.id,
-                communication_type="face-to-face",
-                timestamp=mid_date,
-            )
-        
-        # Others send just a few
-        for i in range(1, 5):
-            comm_repo.create(
-                sender_id=members[i].id,
-                receiver_id=members[0].id,
-                team_id=team.id,
-                communication_type="face-to-face",
-                timestamp=mid_date,
-            )
+        # Member 0 sends 95% of communications; others send just a few
+        comm_repo.bulk_create(
+            [
+                {
+                    "sender_id": members[0].id,
+                    "receiver_id": members[i % 4 + 1].id,
+                    "team_id": team.id,
+                    "communication_type": "face-to-face",
+                    "timestamp": mid_date,
+                }
+                for i in range(95)
+            ]
+            + [
+                {
+                    "sender_id": members[i].id,
+                    "receiver_id": members[0].id,
+                    "team_id": team.id,
+                    "communication_type": "face-to-face",
+                    "timestamp": mid_date,
+                }
+                for i in range(1, 5)
+            ]
+        )
         
         result = calculator.calculate_engagement(team.id, thirty_days_ago, now)
         
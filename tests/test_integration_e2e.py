@@ -8,7 +8,7 @@ simulating real-world usage scenarios.
 import pytest
 import json
 from datetime import datetime, timedelta, timezone
-from app import create_app
+from app.app import create_app
 from app.config import Config
 
 
@@ -17,12 +17,18 @@ class TestConfig(Config):
     DATABASE_URL = "sqlite:///:memory:"
     TESTING = True
     SECRET_KEY = "test-secret-key"
+    # The app outlives each test (module-scoped), so cached bodies must not either
+    RESPONSE_CACHE_TTL = 0
 
 
-@pytest.fixture
-def app():
-    """Create Flask app for testing"""
-    return create_app(config_class=TestConfig)
+# Every test gets the app's DB back in its just-created state (see conftest)
+pytestmark = pytest.mark.usefixtures("clean_app_db")
+
+
+@pytest.fixture(scope="module")
+def app(app_engine):
+    """Create the Flask app once per module; ``clean_app_db`` isolates tests"""
+    return create_app(config_class=TestConfig, engine=app_engine)
 
 
 @pytest.fixture
@@ -2,8 +2,16 @@
 Tests for NetworkAnalyzer.
 """
 
+import networkx as nx
 import pytest
+from networkx.algorithms.community import greedy_modularity_communities, modularity
+
 from app.business_logic import NetworkAnalyzer
+from app.business_logic.three_es_calculator import (
+    _betweenness_centrality,
+    _closeness_centrality,
+    _modularity,
+)
 
 
 class TestNetworkConstruction:
@@ -58,6 +66,26 @@ class TestNetworkConstruction:
         
         assert G[members[0].id][members[1].id]["weight"] == 5
 
+    def test_network_reused_within_analyzer(self, session, sample_team, comm_repo, thirty_days_ago, now, mid_date):
+        """Test the graph is built once per window until the cache is cleared"""
+        team, members = sample_team
+        analyzer = NetworkAnalyzer(session)
+
+        G = analyzer.build_communication_network(team.id, thirty_days_ago, now)
+        assert analyzer.build_communication_network(team.id, thirty_days_ago, now) is G
+
+        comm_repo.create(
+            sender_id=members[0].id,
+            receiver_id=members[1].id,
+            team_id=team.id,
+            communication_type="chat",
+            timestamp=mid_date,
+        )
+        analyzer.clear_cache()
+
+        G = analyzer.build_communication_network(team.id, thirty_days_ago, now)
+        assert G.has_edge(members[0].id, members[1].id)
+
 
 class TestNetworkMetrics:
     """Tests for network metrics calculation"""
@@ -206,3 +234,41 @@ class TestCentralityAnalysis:
         
         # Should handle gracefully
         assert "centrality_metrics" in result or "error" in result
+
+
+def _parity_graphs():
+    """Connected, disconnected (with an isolate) and tiny graphs with integer weights"""
+    graphs = [
+        nx.connected_watts_strogatz_graph(30, 4, 0.3, seed=1),
+        nx.gnp_random_graph(25, 0.08, seed=2),
+        nx.path_graph(2),
+    ]
+    graphs[1].add_node("isolate")
+    for i, G in enumerate(graphs):
+        for j, (u, v) in enumerate(G.edges()):
+            G[u][v]["weight"] = 1 + (i + j) % 4
+    return graphs
+
+
+class TestIgraphParity:
+    """igraph-backed helpers must match the networkx results they replace"""
+
+    @pytest.fixture(autouse=True)
+    def _require_igraph(self):
+        pytest.importorskip("igraph")
+
+    @pytest.mark.parametrize("G", _parity_graphs())
+    def test_betweenness_matches_networkx(self, G):
+        expected = nx.betweenness_centrality(G)
+        assert _betweenness_centrality(G) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("G", _parity_graphs())
+    def test_closeness_matches_networkx(self, G):
+        expected = nx.closeness_centrality(G)
+        assert _closeness_centrality(G) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("G", _parity_graphs())
+    def test_modularity_matches_networkx(self, G):
+        communities = [list(c) for c in greedy_modularity_communities(G, weight="weight")]
+        expected = modularity(G, [set(c) for c in communities])
+        assert _modularity(G, communities) == pytest.approx(expected)
@@ -0,0 +1,51 @@
+"""
+Tests for repository queries not exercised through the calculators.
+"""
+
+from types import SimpleNamespace
+
+from app.data_access.repositories import CommunicationRepository
+
+
+class _PgSession:
+    """Session stand-in with a PostgreSQL bind that returns a fixed reltuples value"""
+
+    def __init__(self, reltuples):
+        self.reltuples = reltuples
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def execute(self, statement):
+        return SimpleNamespace(scalar=lambda: self.reltuples)
+
+
+class TestEstimatedRowCount:
+    """Tests for CommunicationRepository.estimated_row_count"""
+
+    def test_no_estimate_without_planner_statistics(self, comm_repo):
+        """SQLite keeps no row estimate, and the exact count is never run instead"""
+        assert comm_repo.estimated_row_count() is None
+
+    def test_postgres_reads_reltuples(self):
+        assert CommunicationRepository(_PgSession(1234)).estimated_row_count() == 1234
+
+    def test_postgres_unanalyzed_table_has_no_estimate(self):
+        # reltuples is -1 on PG 14+ and 0 on older versions until the first ANALYZE
+        assert CommunicationRepository(_PgSession(-1)).estimated_row_count() is None
+        assert CommunicationRepository(_PgSession(0)).estimated_row_count() is None
+
+
+class TestMemberGetAll:
+    """Tests for TeamMemberRepository.get_all"""
+
+    def test_returns_every_member_by_default(self, member_repo, sample_team):
+        _, members = sample_team
+        assert [m.id for m in member_repo.get_all()] == sorted(m.id for m in members)
+
+    def test_pages_by_id(self, member_repo, sample_team):
+        ids = sorted(m.id for m in sample_team[1])
+        first = member_repo.get_all(limit=3)
+        assert [m.id for m in first] == ids[:3]
+        rest = member_repo.get_all(limit=3, after_id=first[-1].id)
+        assert [m.id for m in rest] == ids[3:]
@@ -0,0 +1,39 @@
+"""
+Tests for the metrics response cache.
+"""
+
+from app.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for the in-process ResponseCache backend"""
+
+    def test_set_and_get(self):
+        cache = ResponseCache(ttl=60)
+        cache.set("metrics:all", b"[]")
+        assert cache.get("metrics:all") == b"[]"
+
+    def test_miss_returns_none(self):
+        cache = ResponseCache(ttl=60)
+        assert cache.get("metrics:team:1") is None
+
+    def test_delete_invalidates(self):
+        cache = ResponseCache(ttl=60)
+        cache.set("metrics:team:1", b"{}")
+        cache.set("metrics:all", b"[]")
+        cache.delete("metrics:team:1", "metrics:all")
+        assert cache.get("metrics:team:1") is None
+        assert cache.get("metrics:all") is None
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        cache = ResponseCache(ttl=10)
+        clock = [100.0]
+        monkeypatch.setattr("app.response_cache.time.monotonic", lambda: clock[0])
+        cache.set("metrics:all", b"[]")
+        clock[0] += 11
+        assert cache.get("metrics:all") is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = ResponseCache(ttl=0)
+        cache.set("metrics:all", b"[]")
+        assert cache.get("metrics:all") is None
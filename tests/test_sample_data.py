@@ -0,0 +1,28 @@
+"""
+Tests for SampleDataGenerator.
+"""
+
+from app.sample_data import SampleDataGenerator
+
+
+class TestGenerateSampleTeam:
+    """Tests for generate_sample_team"""
+
+    def test_team_without_members_is_committed(self, session, monkeypatch):
+        """The team is committed even when there are no members to insert"""
+        commits = []
+        monkeypatch.setattr(session, "commit", lambda: commits.append(True))
+
+        team = SampleDataGenerator(session).generate_sample_team(num_members=0)
+
+        assert team.id is not None
+        assert commits == [True]
+
+    def test_commit_false_leaves_transaction_open(self, session, monkeypatch):
+        commits = []
+        monkeypatch.setattr(session, "commit", lambda: commits.append(True))
+
+        team = SampleDataGenerator(session).generate_sample_team(num_members=3, commit=False)
+
+        assert len(team.members) == 3
+        assert commits == []